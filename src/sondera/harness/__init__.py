@@ -1,10 +1,12 @@
 from .abc import Harness
+from .cache import AdjudicationCache
 from .cedar.harness import CedarPolicyHarness
 from .sondera.harness import SonderaRemoteHarness
 from .trajectory.abc import TrajectoryStorage
 from .trajectory.file_storage import FileTrajectoryStorage
 
 __all__ = [
+    "AdjudicationCache",
     "SonderaRemoteHarness",
     "CedarPolicyHarness",
     "Harness",
@@ -0,0 +1,88 @@
+"""In-process cache of adjudication verdicts keyed by event content."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from sondera.types import Adjudicated, Decision
+
+
+class AdjudicationCache:
+    """Bounded LRU cache of ``Allow`` verdicts keyed by a content fingerprint.
+
+    Integrations build a key from the parts of an event that determine its
+    verdict (kind, role or tool name, text) with :meth:`key`, look it up before
+    calling the harness, and store the result afterwards.
+
+    Only ``Decision.Allow`` verdicts are stored, so denials and escalations are
+    always re-evaluated. Allows on which a signature guardrail fired are not
+    stored either: content the server flagged is re-checked every time.
+
+    A cache hit skips the harness call entirely, which means the repeated
+    event is not recorded on the trajectory.
+
+    Args:
+        maxsize: Maximum number of verdicts to keep. Least recently used
+            entries are evicted first.
+        ttl: Optional lifetime of an entry in seconds. ``None`` keeps entries
+            until they are evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[Adjudicated, float | None]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def key(*parts: str) -> bytes:
+        """Return a 128-bit fingerprint of the given content parts."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            encoded = part.encode()
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Adjudicated | None:
+        """Return the cached verdict for ``key``, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        adjudicated, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return adjudicated
+
+    def put(self, key: bytes, adjudicated: Adjudicated) -> None:
+        """Store ``adjudicated`` under ``key`` if it is a clean ``Allow``."""
+        if adjudicated.decision != Decision.Allow or _flagged(adjudicated):
+            return
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        self._entries[key] = (adjudicated, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached verdict."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _flagged(adjudicated: Adjudicated) -> bool:
+    """Whether a signature guardrail fired on ``adjudicated``."""
+    guardrails = adjudicated.guardrails
+    if not guardrails:
+        return False
+    signature = guardrails.signature
+    return bool(signature and signature.triggered)
@@ -374,7 +374,8 @@ class CedarPolicyHarness(AbstractHarness):
         """Persist step to storage."""
         if not self._agent or not self._trajectory_id:
             return
-        step = AdjudicatedStep(event=event, adjudication=adjudication)
+        # Both fields are already typed PyO3 objects; skip Pydantic validation.
+        step = AdjudicatedStep.model_construct(event=event, adjudication=adjudication)
         self._storage.append_step(
             self._agent.id,
             self._trajectory_id,
@@ -13,7 +13,7 @@ from sondera.exceptions import (
     TrajectoryNotInitializedError,
 )
 from sondera.harness.abc import Harness as AbstractHarness
-from sondera.settings import SETTINGS
+from sondera.settings import get_settings
 from sondera.types import (
     Adjudicated,
     Agent,
@@ -28,6 +28,10 @@ from sondera.types import (
     TrajectoryStatus,
 )
 
+# Default for constructor arguments that are read from settings at call time,
+# so importing this module does not load the env files.
+_FROM_SETTINGS: Any = object()
+
 
 def _parse_dt(val: Any) -> datetime:
     """Parse a value to datetime, falling back to now(UTC)."""
@@ -78,19 +82,35 @@ class SonderaRemoteHarness(AbstractHarness):
         self,
         *,
         agent: Agent | None = None,
-        sondera_harness_endpoint: str = SETTINGS.sondera_harness_endpoint,
-        sondera_api_key: str | None = SETTINGS.sondera_api_token,
+        sondera_harness_endpoint: str = _FROM_SETTINGS,
+        sondera_api_key: str | None = _FROM_SETTINGS,
+        client: HarnessClient | None = None,
     ):
         """Initialize the harness.
 
         Args:
             agent: The ``Agent`` identity to govern.
             sondera_harness_endpoint: The endpoint of the Sondera Harness service.
-            sondera_api_key: JWT token for authentication (required).
+                Defaults to ``SONDERA_HARNESS_ENDPOINT`` from settings.
+            sondera_api_key: JWT token for authentication (required). Defaults
+                to ``SONDERA_API_TOKEN`` from settings.
+            client: An existing ``HarnessClient`` (see ``client``) to reuse
+                instead of opening a new connection. It must have been built
+                for the same endpoint and token.
 
         Raises:
             ConfigurationError: If sondera_api_key is None or empty.
         """
+        if (
+            sondera_harness_endpoint is _FROM_SETTINGS
+            or sondera_api_key is _FROM_SETTINGS
+        ):
+            settings = get_settings()
+            if sondera_harness_endpoint is _FROM_SETTINGS:
+                sondera_harness_endpoint = settings.sondera_harness_endpoint
+            if sondera_api_key is _FROM_SETTINGS:
+                sondera_api_key = settings.sondera_api_token
+
         if not sondera_api_key:
             raise ConfigurationError(
                 "sondera_api_key is required and cannot be None or empty"
@@ -108,11 +128,22 @@ class SonderaRemoteHarness(AbstractHarness):
             endpoint = f"http://{endpoint}" if is_local else f"https://{endpoint}"
         self._sondera_harness_endpoint = endpoint
 
-        self._client = HarnessClient(endpoint, sondera_api_key)
+        self._client = (
+            client if client is not None else HarnessClient(endpoint, sondera_api_key)
+        )
 
         # Current trajectory state
         self._trajectory_id: str | None = None
 
+    @property
+    def client(self) -> HarnessClient:
+        """The underlying client, shareable between harness instances.
+
+        The client carries no trajectory state, so several harnesses (one per
+        trajectory) can multiplex their calls over its single connection.
+        """
+        return self._client
+
     # -- Lifecycle methods ----------------------------------------------------
 
     async def initialize(
@@ -156,8 +156,10 @@ class FileTrajectoryStorage(TrajectoryStorage):
             if not line.strip():
                 continue
             s = json.loads(line)
+            # from_dict already builds typed objects, so skip re-validating
+            # every step of the file.
             steps.append(
-                AdjudicatedStep(
+                AdjudicatedStep.model_construct(
                     event=Event.from_dict(s["event"]),
                     adjudication=Adjudicated.from_dict(s["adjudication"]),
                 )
@@ -1,9 +1,28 @@
-"""LangChain/LangGraph integration package for the Sondera SDK."""
+"""LangChain/LangGraph integration package for the Sondera SDK.
 
-from .analyze import analyze_langchain_tools, create_agent_from_langchain_tools
-from .exceptions import GuardrailViolationError
-from .graph import SonderaGraph
-from .middleware import SonderaHarnessMiddleware, Strategy
+Public names are resolved lazily so that importing ``sondera.langgraph`` does
+not pull in LangChain until an integration class or helper is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyze import analyze_langchain_tools, create_agent_from_langchain_tools
+    from .exceptions import GuardrailViolationError
+    from .graph import SonderaGraph
+    from .middleware import SonderaHarnessMiddleware, Strategy
+
+_LAZY_IMPORTS = {
+    "GuardrailViolationError": ".exceptions",
+    "SonderaHarnessMiddleware": ".middleware",
+    "SonderaGraph": ".graph",
+    "Strategy": ".middleware",
+    "analyze_langchain_tools": ".analyze",
+    "create_agent_from_langchain_tools": ".analyze",
+}
 
 __all__ = [
     "GuardrailViolationError",
@@ -13,3 +32,12 @@ __all__ = [
     "analyze_langchain_tools",
     "create_agent_from_langchain_tools",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -7,12 +7,12 @@ import logging
 from collections.abc import Callable
 from typing import Any, get_type_hints
 
-from langchain_core.tools import BaseTool
-
 from sondera.types import Agent, AgentCard, Parameter, ReActAgentCard, SourceCode, Tool
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 def _python_type_to_json_schema_type(python_type: str) -> str:
     """Convert Python type name to JSON Schema type."""
@@ -39,11 +39,11 @@ def _extract_json_schema_from_pydantic(schema_class: Any) -> str | None:
 
     try:
         # Try Pydantic v2 style first
-        if hasattr(schema_class, "model_json_schema"):
-            return json.dumps(schema_class.model_json_schema())
+        if model_json_schema := getattr(schema_class, "model_json_schema", None):
+            return json.dumps(model_json_schema())
         # Fallback to Pydantic v1 style
-        elif hasattr(schema_class, "schema"):
-            return json.dumps(schema_class.schema())
+        elif schema := getattr(schema_class, "schema", None):
+            return json.dumps(schema())
     except Exception as e:
         logger.debug(f"Could not extract JSON schema from Pydantic model: {e}")
 
@@ -64,15 +64,15 @@ def _extract_tool_json_schemas(tool: Any) -> tuple[str | None, str | None]:
 
     try:
         # For BaseTool instances, extract from args_schema
-        if hasattr(tool, "args_schema") and tool.args_schema is not None:
-            parameters_json_schema = _extract_json_schema_from_pydantic(
-                tool.args_schema
-            )
+        if (args_schema := getattr(tool, "args_schema", None)) is not None:
+            parameters_json_schema = _extract_json_schema_from_pydantic(args_schema)
 
         # Try to get the tool's input schema directly (LangChain provides this)
-        if parameters_json_schema is None and hasattr(tool, "get_input_schema"):
+        if parameters_json_schema is None and (
+            get_input_schema := getattr(tool, "get_input_schema", None)
+        ):
             try:
-                input_schema = tool.get_input_schema()
+                input_schema = get_input_schema()
                 if input_schema is not None:
                     parameters_json_schema = _extract_json_schema_from_pydantic(
                         input_schema
@@ -84,8 +84,8 @@ def _extract_tool_json_schemas(tool: Any) -> tuple[str | None, str | None]:
         func = None
         if inspect.isfunction(tool):
             func = tool
-        elif hasattr(tool, "func") and inspect.isfunction(tool.func):
-            func = tool.func
+        elif inspect.isfunction(tool_func := getattr(tool, "func", None)):
+            func = tool_func
 
         if func is not None and parameters_json_schema is None:
             parameters_json_schema = _build_json_schema_from_function(func)
@@ -293,8 +293,11 @@ def _get_function_return_type(func: Callable) -> str:
 
 def _analyze_langchain_tool(tool: Any) -> Tool:
     """Analyze a LangChain tool and convert it to a Tool definition."""
+    from langchain_core.tools import BaseTool
+
     # Extract JSON schemas for the tool (works for all tool types)
     parameters_json_schema, response_json_schema = _extract_tool_json_schemas(tool)
+    tool_func = getattr(tool, "func", _MISSING)
 
     if inspect.isfunction(tool):
         # It's a raw function decorated with @tool
@@ -321,22 +324,22 @@ def _analyze_langchain_tool(tool: Any) -> Tool:
             source=SourceCode(language=language, code=source_code),
         )
 
-    elif isinstance(tool, BaseTool) or hasattr(tool, "func"):
+    elif isinstance(tool, BaseTool) or tool_func is not _MISSING:
         # It's a BaseTool instance (including StructuredTool from @tool decorator)
         tool_name = tool.name
         tool_description = tool.description or f"Tool {tool_name}"
 
         # If it has a func attribute (from @tool decorator), analyze the underlying function
         # Note: StructuredTool has func attr, but BaseTool doesn't - use getattr for type safety
-        if (func := getattr(tool, "func", None)) and inspect.isfunction(func):
+        if inspect.isfunction(tool_func):
+            func = tool_func
             parameters = _analyze_function_parameters(func)
             response_type = _get_function_return_type(func)
             language, source_code = _get_function_source(func)
         else:
             # For other BaseTool instances, try to extract parameters from the schema
             parameters = []
-            if hasattr(tool, "args_schema") and tool.args_schema:
-                schema = tool.args_schema
+            if schema := getattr(tool, "args_schema", None):
                 # Pydantic v1 style - has __fields__ dict with ModelField objects
                 if v1_fields := getattr(schema, "__fields__", None):
                     for field_name, field_info in v1_fields.items():
@@ -388,14 +391,15 @@ def _analyze_langchain_tool(tool: Any) -> Tool:
             # Try to get source code from various methods
             language = "python"
             source_code = f"# BaseTool instance: {tool_name}"
-            for method_name in ["_run", "_arun", "run", "__call__"]:
-                if hasattr(tool, method_name):
-                    try:
-                        method = getattr(tool, method_name)
-                        source_code = inspect.getsource(method)
-                        break
-                    except Exception:
-                        pass
+            for method_name in ("_run", "_arun", "run", "__call__"):
+                method = getattr(tool, method_name, _MISSING)
+                if method is _MISSING:
+                    continue
+                try:
+                    source_code = inspect.getsource(method)
+                    break
+                except Exception:
+                    pass
 
         return Tool(
             name=tool_name,
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from collections.abc import AsyncIterator, Iterator
-from typing import Any
-
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from typing import TYPE_CHECKING, Any
 
 from sondera.harness import Harness
 from sondera.types import (
@@ -22,10 +21,8 @@ from sondera.types import (
 
 from .exceptions import GuardrailViolationError
 
-try:
-    from langgraph.graph.state import CompiledStateGraph
-except ImportError:  # pragma: no cover
-    CompiledStateGraph = None  # type: ignore[assignment,misc]
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
 LOGGER = logging.getLogger(__name__)
 
@@ -159,7 +156,7 @@ class SonderaGraph:
             # violation on the first message is still caught and trajectory cleaned up)
             if isinstance(input, dict) and "messages" in input and input["messages"]:
                 initial_msg = input["messages"][0]
-                if isinstance(initial_msg, HumanMessage | BaseMessage):
+                if isinstance(initial_msg, _base_message_cls()):
                     await self._record_step(
                         event_payload=Prompt.user(_message_to_text(initial_msg)),
                         node="user_input",
@@ -177,11 +174,7 @@ class SonderaGraph:
                 ):
                     if mode == "updates":
                         if isinstance(chunk, dict):
-                            for node_name, node_state in chunk.items():
-                                await self._record_node_execution(
-                                    node_name=node_name,
-                                    node_state=node_state,
-                                )
+                            await self._record_node_executions(chunk)
                     elif mode == "values":
                         final_state = chunk
             else:
@@ -197,7 +190,7 @@ class SonderaGraph:
                 and final_state["messages"]
             ):
                 final_msg = final_state["messages"][-1]
-                if isinstance(final_msg, AIMessage | BaseMessage):
+                if isinstance(final_msg, _base_message_cls()):
                     await self._record_step(
                         event_payload=Thought(_message_to_text(final_msg)),
                         node="final_output",
@@ -306,12 +299,10 @@ class SonderaGraph:
                 if track and is_multi:
                     mode, data = chunk
                     if mode == "updates" and isinstance(data, dict):
-                        for node_name, node_state in data.items():
-                            await self._record_node_execution(node_name, node_state)
+                        await self._record_node_executions(data)
                 elif track and not is_multi and stream_mode == "updates":
                     if isinstance(chunk, dict):
-                        for node_name, node_state in chunk.items():
-                            await self._record_node_execution(node_name, node_state)
+                        await self._record_node_executions(chunk)
                 yield chunk
             await self._harness.finalize()
         except GuardrailViolationError:
@@ -416,12 +407,21 @@ class SonderaGraph:
 
     # -- Internal helpers -----------------------------------------------------
 
-    async def _record_node_execution(
-        self,
-        node_name: str,
-        node_state: dict[str, Any],
-    ) -> None:
-        """Record a node execution as a trajectory step."""
+    async def _record_node_executions(self, updates: dict[str, Any]) -> None:
+        """Record every node update from one ``updates`` chunk as trajectory steps.
+
+        Nodes that ran in the same superstep arrive in a single chunk and are
+        adjudicated together in one batch call.
+        """
+        await self._record_steps(
+            [
+                (node_name, self._node_output(node_name, node_state))
+                for node_name, node_state in updates.items()
+            ]
+        )
+
+    def _node_output(self, node_name: str, node_state: Any) -> ToolOutput:
+        """Build the ``ToolOutput`` payload describing a node's state update."""
         # Extract meaningful content from the node's state update
         if (
             isinstance(node_state, dict)
@@ -429,17 +429,13 @@ class SonderaGraph:
             and node_state["messages"]
         ):
             last_msg = node_state["messages"][-1]
-            if isinstance(last_msg, BaseMessage):
+            if isinstance(last_msg, _base_message_cls()):
                 content = _message_to_text(last_msg)
             else:
                 content = str(last_msg)
         else:
             content = f"Node '{node_name}' updated state"
-
-        await self._record_step(
-            event_payload=ToolOutput.from_success(node_name, content),
-            node=node_name,
-        )
+        return ToolOutput.from_success(node_name, content)
 
     async def _record_step(
         self,
@@ -448,32 +444,71 @@ class SonderaGraph:
         node: str,
     ) -> Adjudicated:
         """Record and adjudicate a trajectory step."""
+        [adjudicated] = await self._record_steps([(node, event_payload)])
+        return adjudicated
+
+    async def _record_steps(self, steps: list[tuple[str, Any]]) -> list[Adjudicated]:
+        """Record and adjudicate trajectory steps, batching when there are several.
+
+        Args:
+            steps: ``(node, event_payload)`` pairs in execution order.
+
+        Returns:
+            One ``Adjudicated`` verdict per step, in order.
+
+        Raises:
+            GuardrailViolationError: If enforcement is on and any step is denied
+                in ``Mode.Govern``. The first denied step in order is reported.
+        """
+        if not steps:
+            return []
         assert self._harness.agent is not None, "Harness not initialized"
         assert self._harness.trajectory_id is not None, "Harness not initialized"
-        event = Event(
-            agent=self._harness.agent,
-            trajectory_id=self._harness.trajectory_id,
-            event=event_payload,
-        )
-        adjudicated = await self._harness.adjudicate(event)
-
-        if (
-            adjudicated.decision is Decision.Deny
-            and self._enforce
-            and adjudicated.mode == Mode.Govern
-        ):
-            raise GuardrailViolationError(
-                event_type=event.event_type,
-                node=node,
-                reason=adjudicated.deny_message("Policy violation"),
+        events = [
+            Event(
+                agent=self._harness.agent,
+                trajectory_id=self._harness.trajectory_id,
+                event=event_payload,
             )
+            for _, event_payload in steps
+        ]
+        if len(events) == 1:
+            results = [await self._harness.adjudicate(events[0])]
+        else:
+            results = await self._harness.adjudicates(events)
 
-        return adjudicated
+        if self._enforce:
+            for (node, _), event, adjudicated in zip(
+                steps, events, results, strict=True
+            ):
+                if (
+                    adjudicated.decision is Decision.Deny
+                    and adjudicated.mode == Mode.Govern
+                ):
+                    raise GuardrailViolationError(
+                        event_type=event.event_type,
+                        node=node,
+                        reason=adjudicated.deny_message("Policy violation"),
+                    )
+
+        return results
+
+
+@functools.cache
+def _base_message_cls() -> type[BaseMessage]:
+    """Return LangChain's ``BaseMessage``, importing it on first use.
+
+    LangChain is not imported at module load so that importing
+    ``sondera.langgraph`` stays cheap.
+    """
+    from langchain_core.messages import BaseMessage
+
+    return BaseMessage
 
 
 def _message_to_text(message: BaseMessage | Any) -> str:
     """Extract text content from a message."""
-    if isinstance(message, BaseMessage):
+    if isinstance(message, _base_message_cls()):
         if isinstance(message.content, str):
             return message.content
         return str(message.content)
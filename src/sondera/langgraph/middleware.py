@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import uuid
@@ -41,7 +43,7 @@ try:
 except ImportError:
     END: str = "__end__"
 
-from sondera.harness import Harness
+from sondera.harness import AdjudicationCache, Harness
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -123,6 +125,9 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
         *,
         session_id: str | None = None,
         strategy: Strategy = Strategy.BLOCK,
+        speculative: bool = False,
+        cache_maxsize: int = 0,
+        cache_ttl: float | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         """Initialize the Sondera Harness Middleware.
@@ -134,22 +139,84 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
                 all turns share the same session_id even if LangGraph state is not
                 threaded between calls.
             strategy: How to handle policy violations (BLOCK or STEER)
+            speculative: Start the model call concurrently with the pre-model
+                adjudication instead of waiting for the verdict first. The
+                speculative call is cancelled if the verdict is an enforced
+                deny, so the model may see (and bill for) a request that ends
+                up discarded.
+            cache_maxsize: Number of ``Allow`` verdicts to remember by content
+                fingerprint so identical prompts, tool calls, and tool outputs
+                skip the harness round-trip. ``0`` (the default) disables the
+                cache. Cache hits are not recorded on the trajectory, so only
+                enable this when policies are deterministic in event content.
+            cache_ttl: Optional lifetime of a cached verdict in seconds.
         """
         self._harness = harness
         self._session_id = session_id
-        self._strategy = strategy
+        self._strategy = Strategy(strategy)
+        # Fixed for the middleware's lifetime; hooks test these instead of
+        # comparing enums on every deny.
+        self._block = self._strategy is Strategy.BLOCK
+        self._strategy_name = self._strategy.value
+        self._speculative = speculative
+        self._cache = (
+            AdjudicationCache(cache_maxsize, cache_ttl) if cache_maxsize > 0 else None
+        )
         self._log = logger or _LOGGER
         super().__init__()
 
-    def _make_event(self, payload: Any) -> Event:
-        """Build an Event envelope for the current trajectory."""
-        assert self._harness.agent is not None, "Harness not initialized"
-        assert self._harness.trajectory_id is not None, "Harness not initialized"
-        return Event(
-            agent=self._harness.agent,
-            trajectory_id=self._harness.trajectory_id,
-            event=payload,
-        )
+    def _make_events(self, payloads: list[Any]) -> list[Event]:
+        """Build Event envelopes for the current trajectory.
+
+        The agent and trajectory id are read and checked once per batch rather
+        than once per payload.
+        """
+        agent = self._harness.agent
+        trajectory_id = self._harness.trajectory_id
+        assert agent is not None, "Harness not initialized"
+        assert trajectory_id is not None, "Harness not initialized"
+        return [
+            Event(agent=agent, trajectory_id=trajectory_id, event=payload)
+            for payload in payloads
+        ]
+
+    async def _adjudicate(self, payload: Any, *key_parts: str) -> Adjudicated:
+        """Adjudicate one payload, consulting the verdict cache if enabled.
+
+        ``key_parts`` identify the payload's content for the cache.
+        """
+        [adjudicated] = await self._adjudicate_all([(payload, key_parts)])
+        return adjudicated
+
+    async def _adjudicate_all(
+        self, items: list[tuple[Any, tuple[str, ...]]]
+    ) -> list[Adjudicated]:
+        """Adjudicate ``(payload, key_parts)`` pairs, preserving order.
+
+        Cached verdicts are reused when the cache is enabled. Of the rest, a
+        single payload goes through ``adjudicate``; several are sent together
+        through ``adjudicates`` so they cost one round-trip instead of one each.
+        """
+        cache = self._cache
+        keys = [
+            cache.key(*key_parts) if cache is not None else b""
+            for _, key_parts in items
+        ]
+        results: list[Adjudicated | None] = [
+            cache.get(key) if cache is not None else None for key in keys
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            events = self._make_events([items[i][0] for i in pending])
+            if len(events) == 1:
+                fresh = [await self._harness.adjudicate(events[0])]
+            else:
+                fresh = await self._harness.adjudicates(events)
+            for i, adjudicated in zip(pending, fresh, strict=True):
+                results[i] = adjudicated
+                if cache is not None:
+                    cache.put(keys[i], adjudicated)
+        return results  # type: ignore[return-value]
 
     @hook_config(can_jump_to=["end"])
     async def abefore_agent(
@@ -188,42 +255,36 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
         )
 
         # Extract user message from state
-        user_message = _extract_last_user_message(state)
-        if user_message is None:
+        content = _extract_last_user_text(state)
+        if content is None:
             self._log.debug(
                 "[SonderaHarness] No user message found in state, skipping pre-agent check"
             )
             # Still return trajectory_id if we just created one
             return updates if updates else None
 
-        content = _message_to_text(user_message)
         self._log.debug(
-            f"[SonderaHarness] Evaluating user input for trajectory {self._harness.trajectory_id}"
+            "[SonderaHarness] Evaluating user input for trajectory %s",
+            self._harness.trajectory_id,
         )
 
-        adjudicated = await self._harness.adjudicate(
-            self._make_event(Prompt.user(content)),
+        adjudicated = await self._adjudicate(
+            Prompt.user(content), "prompt", "user", content
         )
         self._log.info(
-            f"[SonderaHarness] Before Agent Adjudication for trajectory {self._harness.trajectory_id}"
+            "[SonderaHarness] Before Agent Adjudication for trajectory %s",
+            self._harness.trajectory_id,
         )
 
-        _log_guardrails(self._log, adjudicated, self._harness.trajectory_id)
-
-        if adjudicated.decision == Decision.Deny:
-            if adjudicated.mode != Mode.Govern:
-                self._log.info(
-                    "[SonderaHarness] Non-enforcing mode (%s) deny for trajectory %s — allowing",
-                    adjudicated.mode,
-                    self._harness.trajectory_id,
-                )
-                return updates if updates else None
-            reason = _deny_reason(adjudicated, "Policy violation")
-            self._log.warning(
-                f"[SonderaHarness] Policy violation detected (strategy={self._strategy.value}): "
-                f"{reason}"
-            )
-            if self._strategy == Strategy.BLOCK:
+        reason = self._enforced_deny_reason(
+            adjudicated,
+            "Pre-agent",
+            "user input",
+            "Policy violation",
+            self._harness.trajectory_id,
+        )
+        if reason is not None:
+            if self._block:
                 return {
                     "messages": [AIMessage(content=reason)],
                     "jump_to": "end",
@@ -237,12 +298,6 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
                 **updates,
             }
 
-        if adjudicated.decision == Decision.Escalate:
-            self._log.info(
-                f"[SonderaHarness] Escalation flagged for trajectory "
-                f"{self._harness.trajectory_id}: {adjudicated.reason}"
-            )
-
         return updates if updates else None
 
     async def awrap_model_call(
@@ -262,98 +317,102 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
         Returns:
             The model response, potentially modified based on policy
         """
+        handler_task: asyncio.Future[ModelResponse] | None = None
+        # isinstance (not a type identity check) because streamed responses
+        # carry AIMessageChunk, a subclass of AIMessage.
         if isinstance(request.messages[-1], AIMessage):
             # Last message is an AIMessage, so we need to adjudicate it.
-            _LOGGER.debug(
-                f"[SonderaHarness] Pre-model check for trajectory {self._harness.trajectory_id} {request.messages}"
+            self._log.debug(
+                "[SonderaHarness] Pre-model check for trajectory %s %s",
+                self._harness.trajectory_id,
+                request.messages,
             )
-            pre_adjudicated = await self._harness.adjudicate(
-                self._make_event(
-                    Prompt(_message_to_text(request.messages[-1]), PromptRole.Assistant)
-                ),
+            if self._speculative:
+                # Overlap the model call with the adjudication round-trip; the
+                # result is only used if the request is not denied.
+                handler_task = asyncio.ensure_future(handler(request))
+            try:
+                text = _message_to_text(request.messages[-1])
+                pre_adjudicated = await self._adjudicate(
+                    Prompt(text, PromptRole.Assistant), "prompt", "assistant", text
+                )
+            except BaseException:
+                await _cancel(handler_task)
+                raise
+
+            reason = self._enforced_deny_reason(
+                pre_adjudicated,
+                "Pre-model",
+                "assistant message",
+                "Policy violation",
+                self._harness.trajectory_id,
             )
-
-            _log_guardrails(self._log, pre_adjudicated, self._harness.trajectory_id)
-            if pre_adjudicated.decision == Decision.Deny:
-                if pre_adjudicated.mode != Mode.Govern:
-                    _LOGGER.info(
-                        "[SonderaHarness] Non-enforcing mode (%s) pre-model deny — allowing",
-                        pre_adjudicated.mode,
-                    )
-                else:
-                    reason = _deny_reason(pre_adjudicated, "Policy violation")
-                    _LOGGER.warning(
-                        f"[SonderaHarness] Pre-model policy violation (strategy={self._strategy.value}): "
-                        f"{reason}"
-                    )
-                    message = AIMessage(
-                        content=f"Replaced message due to policy violation: {reason}"
-                    )
-                    if self._strategy == Strategy.STEER:
-                        request.messages[-1] = message
-                    else:
-                        return ModelResponse(
-                            result=[message],
-                            structured_response=None,
-                        )
-            elif pre_adjudicated.decision == Decision.Escalate:
-                self._log.info(
-                    f"[SonderaHarness] Pre-model escalation flagged for trajectory "
-                    f"{self._harness.trajectory_id}: {pre_adjudicated.reason}"
+            if reason is not None:
+                message = AIMessage(
+                    content=f"Replaced message due to policy violation: {reason}"
                 )
+                await _cancel(handler_task)
+                handler_task = None
+                if self._block:
+                    return ModelResponse(result=[message], structured_response=None)
+                request.messages[-1] = message
+
+        # Call the actual model (or collect the speculative call's result)
+        response: ModelResponse = (
+            await handler_task if handler_task is not None else await handler(request)
+        )
 
-        # Call the actual model
-        response: ModelResponse = await handler(request)
-
-        # Post-model check on each AI message in the response
-        sanitized_messages: list[BaseMessage] = []
-        for message in response.result:
-            if isinstance(message, AIMessage):
-                post_adjudicated = await self._harness.adjudicate(
-                    self._make_event(Prompt(message.text, PromptRole.Assistant)),
-                )
-                self._log.info(
-                    f"[SonderaHarness] Post-model Adjudication for trajectory {self._harness.trajectory_id}"
-                )
-                _log_guardrails(
-                    self._log, post_adjudicated, self._harness.trajectory_id
-                )
-                if post_adjudicated.decision == Decision.Deny:
-                    if post_adjudicated.mode != Mode.Govern:
-                        self._log.info(
-                            "[SonderaHarness] Non-enforcing mode (%s) post-model deny — allowing",
-                            post_adjudicated.mode,
-                        )
-                        sanitized_messages.append(message)
-                    else:
-                        reason = _deny_reason(post_adjudicated, "Policy violation")
-                        self._log.warning(
-                            f"[SonderaHarness] Post-model policy violation (strategy={self._strategy.value}): "
-                            f"{reason}"
-                        )
-                        message = AIMessage(
-                            content=f"Replaced message due to policy violation: {reason}"
-                        )
-                        if self._strategy == Strategy.STEER:
-                            sanitized_messages.append(message)
-                        else:
-                            return ModelResponse(
-                                result=[message],
-                                structured_response=response.structured_response,
-                            )
-                else:
-                    if post_adjudicated.decision == Decision.Escalate:
-                        self._log.info(
-                            f"[SonderaHarness] Post-model escalation flagged for trajectory "
-                            f"{self._harness.trajectory_id}: {post_adjudicated.reason}"
-                        )
-                    sanitized_messages.append(message)
-            else:
-                self._log.debug(
-                    f"[SonderaHarness] Non-AIMessage in response: {message} in trajectory {self._harness.trajectory_id}"
+        # Post-model check on each AI message in the response, adjudicated as
+        # one batch and matched back to the messages by index. Responses with
+        # no AI messages (e.g. tool-only) pass through untouched.
+        ai_indices = [
+            index
+            for index, message in enumerate(response.result)
+            if isinstance(message, AIMessage)
+        ]
+        if not ai_indices:
+            return response
+
+        # Each message's text is derived once and shared by payload and cache key.
+        ai_texts = [response.result[index].text for index in ai_indices]
+        post_verdicts = await self._adjudicate_all(
+            [
+                (Prompt(text, PromptRole.Assistant), ("prompt", "assistant", text))
+                for text in ai_texts
+            ]
+        )
+        # Copied only when a message is replaced; if every message passes, the
+        # handler's response is returned as-is.
+        sanitized_messages: list[BaseMessage] | None = None
+        trajectory_id = self._harness.trajectory_id
+        for index, post_adjudicated in zip(ai_indices, post_verdicts, strict=True):
+            self._log.info(
+                "[SonderaHarness] Post-model Adjudication for trajectory %s",
+                trajectory_id,
+            )
+            reason = self._enforced_deny_reason(
+                post_adjudicated,
+                "Post-model",
+                "model output",
+                "Policy violation",
+                trajectory_id,
+            )
+            if reason is None:
+                continue
+            message = AIMessage(
+                content=f"Replaced message due to policy violation: {reason}"
+            )
+            if self._block:
+                return ModelResponse(
+                    result=[message],
+                    structured_response=response.structured_response,
                 )
-                sanitized_messages.append(message)
+            if sanitized_messages is None:
+                sanitized_messages = list(response.result)
+            sanitized_messages[index] = message
 
+        if sanitized_messages is None:
+            return response
         return ModelResponse(
             result=sanitized_messages,
             structured_response=response.structured_response,
@@ -376,9 +435,12 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
         Returns:
             The tool response, potentially modified based on policy
         """
-        tool_name = request.tool_call.get("name", "unknown_tool")
-        tool_args = request.tool_call.get("args", {})
-        tool_call_id: str = request.tool_call.get("id") or ""
+        # Read the tool call fields once; every branch below uses these locals.
+        tool_call = request.tool_call
+        tool_name = tool_call.get("name", "unknown_tool")
+        tool_args = tool_call.get("args", {})
+        tool_call_id: str = tool_call.get("id") or ""
+        trajectory_id = self._harness.trajectory_id
 
         # Serialize args to JSON string for the ToolCall payload
         args_str = (
@@ -387,58 +449,36 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
 
         # Pre-tool check
         self._log.debug(
-            f"[SonderaHarness] Pre-tool check for {tool_name} in trajectory {self._harness.trajectory_id}"
+            "[SonderaHarness] Pre-tool check for %s in trajectory %s",
+            tool_name,
+            trajectory_id,
         )
-        pre_adjudicated = await self._harness.adjudicate(
-            self._make_event(
-                ToolCall(tool=tool_name, arguments=args_str, call_id=tool_call_id),
-            ),
+        pre_adjudicated = await self._adjudicate(
+            ToolCall(tool=tool_name, arguments=args_str, call_id=tool_call_id),
+            "tool_call",
+            tool_name,
+            args_str,
         )
 
         self._log.info(
-            f"[SonderaHarness] Before Tool Adjudication for trajectory {self._harness.trajectory_id}"
+            "[SonderaHarness] Before Tool Adjudication for trajectory %s",
+            trajectory_id,
         )
-        _log_guardrails(self._log, pre_adjudicated, self._harness.trajectory_id)
-
-        if pre_adjudicated.decision == Decision.Deny:
-            if pre_adjudicated.mode != Mode.Govern:
-                self._log.info(
-                    "[SonderaHarness] Non-enforcing mode (%s) pre-tool deny for %s — allowing",
-                    pre_adjudicated.mode,
-                    tool_name,
-                )
-            else:
-                reason = _deny_reason(
-                    pre_adjudicated, f"Tool '{tool_name}' blocked by policy"
-                )
-                self._log.warning(
-                    f"[SonderaHarness] Pre-tool policy violation for {tool_name} "
-                    f"(strategy={self._strategy.value}): {reason}"
-                )
-                if self._strategy == Strategy.BLOCK:
-                    return Command(
-                        goto=END,
-                        update={
-                            "messages": [
-                                ToolMessage(
-                                    content=f"Tool execution was blocked. {reason}",
-                                    tool_call_id=tool_call_id,
-                                    name=tool_name,
-                                )
-                            ]
-                        },
-                    )
-                # STEER: Return tool message with policy violation instead of allowing execution
-                return ToolMessage(
-                    content=f"Tool execution modified due to policy concern: {reason}",
-                    tool_call_id=tool_call_id,
-                    name=tool_name,
-                )
-
-        if pre_adjudicated.decision == Decision.Escalate:
-            self._log.info(
-                f"[SonderaHarness] Pre-tool escalation flagged for {tool_name} in trajectory "
-                f"{self._harness.trajectory_id}: {pre_adjudicated.reason}"
+        reason = self._enforced_deny_reason(
+            pre_adjudicated,
+            "Pre-tool",
+            tool_name,
+            "Tool '{subject}' blocked by policy",
+            trajectory_id,
+        )
+        if reason is not None:
+            # STEER returns the policy message in place of running the tool
+            return self._tool_denial(
+                tool_name,
+                tool_call_id,
+                reason,
+                blocked="Tool execution was blocked. {reason}",
+                steered="Tool execution modified due to policy concern: {reason}",
             )
 
         # Execute the actual tool
@@ -446,62 +486,107 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
 
         # Post-tool check
         if isinstance(result, ToolMessage):
-            output_text = _tool_message_to_text(result)
+            output_text = _message_to_text(result)
 
-            post_adjudicated = await self._harness.adjudicate(
-                self._make_event(
-                    ToolOutput.from_success(tool_call_id, output_text),
-                ),
+            post_adjudicated = await self._adjudicate(
+                ToolOutput.from_success(tool_call_id, output_text),
+                "tool_output",
+                tool_name,
+                output_text,
             )
 
             self._log.info(
-                f"[SonderaHarness] After Tool Adjudication for trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] After Tool Adjudication for trajectory %s",
+                trajectory_id,
             )
-            _log_guardrails(self._log, post_adjudicated, self._harness.trajectory_id)
-
-            if post_adjudicated.decision == Decision.Deny:
-                if post_adjudicated.mode != Mode.Govern:
-                    self._log.info(
-                        "[SonderaHarness] Non-enforcing mode (%s) post-tool deny for %s — allowing",
-                        post_adjudicated.mode,
-                        tool_name,
-                    )
-                else:
-                    reason = _deny_reason(
-                        post_adjudicated, f"Tool '{tool_name}' output blocked by policy"
-                    )
-                    self._log.warning(
-                        f"[SonderaHarness] Post-tool policy violation for {tool_name} "
-                        f"(strategy={self._strategy.value}): {reason}"
-                    )
-                    if self._strategy == Strategy.BLOCK:
-                        return Command(
-                            goto=END,
-                            update={
-                                "messages": [
-                                    ToolMessage(
-                                        content=f"Tool result was blocked. {reason}",
-                                        tool_call_id=tool_call_id,
-                                        name=tool_name,
-                                    )
-                                ]
-                            },
-                        )
-                    # STEER: Return modified ToolMessage with policy violation message
-                    return ToolMessage(
-                        content=f"Tool result was modified. {reason}",
-                        tool_call_id=tool_call_id,
-                        name=tool_name,
-                    )
-
-            if post_adjudicated.decision == Decision.Escalate:
-                self._log.info(
-                    f"[SonderaHarness] Post-tool escalation flagged for {tool_name} in trajectory "
-                    f"{self._harness.trajectory_id}: {post_adjudicated.reason}"
+            reason = self._enforced_deny_reason(
+                post_adjudicated,
+                "Post-tool",
+                tool_name,
+                "Tool '{subject}' output blocked by policy",
+                trajectory_id,
+            )
+            if reason is not None:
+                return self._tool_denial(
+                    tool_name,
+                    tool_call_id,
+                    reason,
+                    blocked="Tool result was blocked. {reason}",
+                    steered="Tool result was modified. {reason}",
                 )
 
         return result
 
+    def _enforced_deny_reason(
+        self,
+        adjudicated: Adjudicated,
+        stage: str,
+        subject: str,
+        default_reason: str,
+        trajectory_id: str | None,
+    ) -> str | None:
+        """Log a verdict and return the reason if it is a deny to enforce.
+
+        Every hook routes its verdicts through here. ``None`` means carry on:
+        the event was allowed, escalated (logged only), or denied in a
+        non-enforcing mode. ``default_reason`` may reference ``{subject}``; it
+        is only formatted for an enforced deny.
+        """
+        _log_guardrails(self._log, adjudicated, trajectory_id)
+        decision = adjudicated.decision
+        if decision == Decision.Deny:
+            if adjudicated.mode != Mode.Govern:
+                self._log.info(
+                    "[SonderaHarness] Non-enforcing mode (%s) %s deny for %s in "
+                    "trajectory %s — allowing",
+                    adjudicated.mode,
+                    stage,
+                    subject,
+                    trajectory_id,
+                )
+                return None
+            reason = _deny_reason(adjudicated, default_reason.format(subject=subject))
+            self._log.warning(
+                "[SonderaHarness] %s policy violation for %s (strategy=%s): %s",
+                stage,
+                subject,
+                self._strategy_name,
+                reason,
+            )
+            return reason
+        if decision == Decision.Escalate:
+            self._log.info(
+                "[SonderaHarness] %s escalation flagged for %s in trajectory %s: %s",
+                stage,
+                subject,
+                trajectory_id,
+                adjudicated.reason,
+            )
+        return None
+
+    def _tool_denial(
+        self,
+        tool_name: str,
+        tool_call_id: str,
+        reason: str,
+        *,
+        blocked: str,
+        steered: str,
+    ) -> ToolMessage | Command:
+        """Build the response for an enforced tool deny.
+
+        Only the template for the active strategy is formatted. BLOCK wraps the
+        message in a ``Command`` that ends the run; STEER returns it directly.
+        """
+        message = ToolMessage(
+            content=(blocked if self._block else steered).format(reason=reason),
+            tool_call_id=tool_call_id,
+            name=tool_name,
+        )
+        if self._block:
+            return Command(goto=END, update={"messages": [message]})
+        return message
+
     async def aafter_agent(
         self, state: State, runtime: Runtime
     ) -> dict[str, Any] | None:
@@ -533,8 +618,8 @@ class SonderaHarnessMiddleware(AgentMiddleware[State]):
         return updates if updates else None
 
 
-def _extract_last_user_message(state: AgentState) -> BaseMessage | None:
-    """Extract the last user message from agent state."""
+def _extract_last_user_text(state: AgentState) -> str | None:
+    """Extract the text of the last user message from agent state."""
     messages = state.get("messages", [])
     if not messages:
         return None
@@ -542,33 +627,45 @@ def _extract_last_user_message(state: AgentState) -> BaseMessage | None:
     # Look for the last HumanMessage
     for message in reversed(messages):
         if isinstance(message, HumanMessage):
-            return message
+            return _content_to_text(message.content)
         if isinstance(message, dict) and message.get("role") == "user":
-            return HumanMessage(content=message.get("content", ""))
+            return _content_to_text(message.get("content", ""))
 
     # Fallback to last message if it looks like user input
     last = messages[-1]
     if isinstance(last, dict):
-        return HumanMessage(content=last.get("content", ""))
+        return _content_to_text(last.get("content", ""))
     return None
 
 
 def _message_to_text(message: BaseMessage) -> str:
-    """Convert a message to text content."""
-    if isinstance(message.content, str):
-        return message.content
-    if isinstance(message.content, list):
-        return " ".join(str(chunk) for chunk in message.content)
-    return str(message.content)
-
-
-def _tool_message_to_text(message: ToolMessage) -> str:
-    """Convert a tool message to text content."""
-    if isinstance(message.content, str):
-        return message.content
-    if isinstance(message.content, list):
-        return " ".join(str(chunk) for chunk in message.content)
-    return str(message.content)
+    """Convert a message to text content.
+
+    Hooks call this once per message and reuse the result for logging, the
+    event payload, and the cache key rather than re-walking list content.
+    """
+    return _content_to_text(message.content)
+
+
+def _content_to_text(content: Any) -> str:
+    # Message content is exactly ``str`` or ``list`` in practice, so a type
+    # identity check is enough; anything else (including subclasses) goes
+    # through ``str``.
+    content_type = type(content)
+    if content_type is str:
+        return content
+    if content_type is list:
+        return " ".join(map(str, content))
+    return str(content)
+
+
+async def _cancel(task: asyncio.Future[Any] | None) -> None:
+    """Cancel a speculative task and wait for it to unwind."""
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
 
 
 def _deny_reason(adjudicated: Adjudicated, default: str) -> str:
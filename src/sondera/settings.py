@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -68,11 +69,30 @@ class Settings(BaseSettings):
         return self.ai_provider_name == "gemini"
 
 
-SETTINGS = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading the env files on first use."""
+    # Only env files that exist are handed to pydantic-settings. The check
+    # runs on every (re)load, so a file created later (e.g. by the config
+    # screen) is picked up by reload_settings().
+    env_files = tuple(path for path in (_ENV_PATH, Path(".env")) if path.is_file())
+    return Settings(_env_file=env_files or None)
 
 
 def reload_settings() -> Settings:
     """Reload settings from env files and return the new instance."""
-    global SETTINGS  # noqa: PLW0603
-    SETTINGS = Settings()
-    return SETTINGS
+    get_settings.cache_clear()
+    return get_settings()
+
+
+if TYPE_CHECKING:
+    SETTINGS: Settings
+
+
+def __getattr__(name: str) -> Settings:
+    # ``SETTINGS`` is resolved lazily so importing this module (and everything
+    # that imports it) does not read env files. Access it as an attribute of
+    # the module (``sondera.settings.SETTINGS``) to see reloads.
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,11 @@
 """Strands Agent analysis utilities."""
 
+import functools
 import inspect
 import json
 import logging
+import re
+import weakref
 from collections.abc import Callable
 from typing import Any, get_type_hints
 
@@ -11,6 +14,77 @@ from sondera.types import Agent, AgentCard, Parameter, ReActAgentCard, SourceCod
 logger = logging.getLogger(__name__)
 
 
+# A tool's signature and type hints are read several times while it is
+# analyzed (parameters, return type, response schema), and get_type_hints()
+# evaluates string annotations each time. Both are fixed per function object.
+# The caches hold their keys weakly so tools of dropped agents can be collected.
+_signature_cache: weakref.WeakKeyDictionary[Callable, inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+_type_hints_cache: weakref.WeakKeyDictionary[Callable, dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _resolve_type_hints(func: Callable) -> dict[str, Any]:
+    # Annotations that are already classes need no evaluation, which is the
+    # common case for tools without ``from __future__ import annotations``.
+    annotations = getattr(func, "__annotations__", None)
+    if isinstance(annotations, dict) and all(
+        isinstance(value, type) for value in annotations.values()
+    ):
+        return dict(annotations)
+    try:
+        return get_type_hints(func)
+    except Exception:
+        return {}
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    """Return ``inspect.signature(func)``, memoised per function."""
+    try:
+        return _signature_cache[func]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable or not weak-referenceable
+        return inspect.signature(func)
+    signature = _signature_cache[func] = inspect.signature(func)
+    return signature
+
+
+def _type_hints(func: Callable) -> dict[str, Any]:
+    """Return ``get_type_hints(func)`` (or ``{}`` on failure), memoised per function."""
+    try:
+        return _type_hints_cache[func]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable or not weak-referenceable
+        return _resolve_type_hints(func)
+    hints = _type_hints_cache[func] = _resolve_type_hints(func)
+    return hints
+
+
+# "name: desc" / "name (type): desc" (Google style) and ":param [type] name: desc"
+# (Sphinx style) parameter lines.
+_DOC_PARAM_RE = re.compile(
+    r"^\s*(?::param\s+(?:\S+\s+)?)?(?P<name>\w+)\s*(?:\([^)]*\))?\s*:\s*(?P<desc>.*)$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_doc_params(doc: str) -> dict[str, str]:
+    """Map parameter names to descriptions in a single pass over a docstring.
+
+    The first matching line wins for each name.
+    """
+    params: dict[str, str] = {}
+    for line in doc.splitlines():
+        match = _DOC_PARAM_RE.match(line)
+        if match and match["desc"]:
+            params.setdefault(match["name"], match["desc"].strip())
+    return params
+
+
 def _get_function_source(func: Callable) -> tuple[str, str]:
     """Extract source code and language from a function."""
     try:
@@ -23,12 +97,9 @@ def _get_function_source(func: Callable) -> tuple[str, str]:
 def _analyze_function_parameters(func: Callable) -> list[Parameter]:
     """Analyze function parameters and return Sondera format Parameters."""
     parameters = []
-    sig = inspect.signature(func)
-
-    try:
-        type_hints = get_type_hints(func)
-    except Exception:
-        type_hints = {}
+    sig = _signature(func)
+    type_hints: dict[str, Any] | None = None
+    doc_params = _parse_doc_params(func.__doc__) if func.__doc__ else {}
 
     for param_name, param in sig.parameters.items():
         if param_name in ["tool_context", "self", "cls"]:
@@ -40,17 +111,15 @@ def _analyze_function_parameters(func: Callable) -> list[Parameter]:
                 param_type = param.annotation.__name__
             else:
                 param_type = str(param.annotation)
-        elif param_name in type_hints:
-            hint = type_hints[param_name]
-            param_type = hint.__name__ if isinstance(hint, type) else str(hint)
-
-        description = f"Parameter {param_name}"
-        if func.__doc__:
-            lines = func.__doc__.split("\n")
-            for line in lines:
-                if param_name in line:
-                    description = line.strip()
-                    break
+        else:
+            # Only unannotated parameters need the resolved hints.
+            if type_hints is None:
+                type_hints = _type_hints(func)
+            if param_name in type_hints:
+                hint = type_hints[param_name]
+                param_type = hint.__name__ if isinstance(hint, type) else str(hint)
+
+        description = doc_params.get(param_name, f"Parameter {param_name}")
 
         parameters.append(
             Parameter(name=param_name, description=description, param_type=param_type)
@@ -61,23 +130,20 @@ def _analyze_function_parameters(func: Callable) -> list[Parameter]:
 
 def _get_function_return_type(func: Callable) -> str:
     """Extract the return type from a function."""
-    sig = inspect.signature(func)
+    sig = _signature(func)
     if sig.return_annotation != inspect.Signature.empty:
         if isinstance(sig.return_annotation, type):
             return sig.return_annotation.__name__
         else:
             return str(sig.return_annotation)
 
-    try:
-        type_hints = get_type_hints(func)
-        if "return" in type_hints:
-            hint = type_hints["return"]
-            if isinstance(hint, type):
-                return hint.__name__
-            else:
-                return str(hint)
-    except Exception:
-        pass
+    type_hints = _type_hints(func)
+    if "return" in type_hints:
+        hint = type_hints["return"]
+        if isinstance(hint, type):
+            return hint.__name__
+        else:
+            return str(hint)
 
     return "Any"
 
@@ -115,31 +181,43 @@ def _extract_strands_tool_schema(tool: Any) -> tuple[str | None, str | None]:
         if callable(tool):
             return_type = _get_function_return_type(tool)
             if return_type and return_type != "Any":
-                response_json_schema = json.dumps(
-                    {
-                        "type": _python_type_to_json_schema_type(return_type),
-                        "description": f"Return value of type {return_type}",
-                    }
-                )
+                response_json_schema = _response_schema_json(return_type)
     except Exception as e:
         logger.debug(f"Could not extract JSON schema from tool: {e}")
 
     return parameters_json_schema, response_json_schema
 
 
+_PYTHON_TO_JSON_SCHEMA_TYPE = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object",
+    "None": "null",
+    "NoneType": "null",
+}
+
+
 def _python_type_to_json_schema_type(python_type: str) -> str:
     """Convert Python type name to JSON Schema type."""
-    type_mapping = {
-        "str": "string",
-        "int": "integer",
-        "float": "number",
-        "bool": "boolean",
-        "list": "array",
-        "dict": "object",
-        "None": "null",
-        "NoneType": "null",
-    }
-    return type_mapping.get(python_type, "string")
+    return _PYTHON_TO_JSON_SCHEMA_TYPE.get(python_type, "string")
+
+
+@functools.lru_cache(maxsize=128)
+def _response_schema_json(return_type: str) -> str:
+    """Serialized response JSON schema for a return type name.
+
+    Tools mostly return a handful of types, so the serialized schema is
+    built once per type name and shared.
+    """
+    return json.dumps(
+        {
+            "type": _python_type_to_json_schema_type(return_type),
+            "description": f"Return value of type {return_type}",
+        }
+    )
 
 
 def _extract_tool_info(tool: Any) -> dict[str, Any]:
@@ -175,6 +253,48 @@ def _extract_tool_info(tool: Any) -> dict[str, Any]:
     }
 
 
+def _analyze_one_tool(tool: Any) -> Tool | None:
+    """Build the Sondera Tool for a single Strands tool.
+
+    Returns ``None`` (after logging a warning) if the tool cannot be analyzed.
+    """
+    try:
+        # Extract tool info from tool_spec or attributes
+        tool_info = _extract_tool_info(tool)
+        tool_name = tool_info["name"]
+        tool_description = tool_info["description"]
+
+        # Extract JSON schemas
+        parameters_json_schema, response_json_schema = _extract_strands_tool_schema(
+            tool
+        )
+
+        # Analyze function for additional info
+        if callable(tool):
+            parameters = _analyze_function_parameters(tool)
+            response_type = _get_function_return_type(tool)
+            language, source_code = _get_function_source(tool)
+        else:
+            parameters = []
+            response_type = "Any"
+            language, source_code = "python", f"# Tool object: {tool_name}"
+
+        return Tool(
+            name=tool_name,
+            description=tool_description.strip()
+            if isinstance(tool_description, str)
+            else str(tool_description),
+            parameters=parameters,
+            parameters_json_schema=parameters_json_schema,
+            response=response_type,
+            response_json_schema=response_json_schema,
+            source=SourceCode(language=language, code=source_code),
+        )
+    except Exception as e:
+        logger.warning(f"Could not analyze tool {tool}: {e}")
+        return None
+
+
 def format_strands_agent(agent: Any) -> Agent:
     """Transform a Strands agent into Sondera Agent format.
 
@@ -192,46 +312,9 @@ def format_strands_agent(agent: Any) -> Agent:
     system_prompt = getattr(agent, "system_prompt", "")
 
     # Extract tools
-    tools = []
     agent_tools = getattr(agent, "tools", []) or []
-
-    for tool in agent_tools:
-        try:
-            # Extract tool info from tool_spec or attributes
-            tool_info = _extract_tool_info(tool)
-            tool_name = tool_info["name"]
-            tool_description = tool_info["description"]
-
-            # Extract JSON schemas
-            parameters_json_schema, response_json_schema = _extract_strands_tool_schema(
-                tool
-            )
-
-            # Analyze function for additional info
-            if callable(tool):
-                parameters = _analyze_function_parameters(tool)
-                response_type = _get_function_return_type(tool)
-                language, source_code = _get_function_source(tool)
-            else:
-                parameters = []
-                response_type = "Any"
-                language, source_code = "python", f"# Tool object: {tool_name}"
-
-            tools.append(
-                Tool(
-                    name=tool_name,
-                    description=tool_description.strip()
-                    if isinstance(tool_description, str)
-                    else str(tool_description),
-                    parameters=parameters,
-                    parameters_json_schema=parameters_json_schema,
-                    response=response_type,
-                    response_json_schema=response_json_schema,
-                    source=SourceCode(language=language, code=source_code),
-                )
-            )
-        except Exception as e:
-            logger.warning(f"Could not analyze tool {tool}: {e}")
+    analyzed = [_analyze_one_tool(tool) for tool in agent_tools]
+    tools = [tool for tool in analyzed if tool is not None]
 
     return Agent(
         id=agent_id,
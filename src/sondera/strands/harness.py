@@ -1,5 +1,6 @@
 """Sondera Harness Hook for Strands Agent SDK integration."""
 
+import json
 import logging
 from typing import Any
 
@@ -13,9 +14,10 @@ from strands.hooks.events import (
     BeforeToolCallEvent,
 )
 
-from sondera.harness import Harness
+from sondera.harness import AdjudicationCache, Harness
 from sondera.strands.analyze import format_strands_agent
 from sondera.types import (
+    Adjudicated,
     Decision,
     Event,
     Prompt,
@@ -79,6 +81,9 @@ class SonderaHarnessHook(HookProvider):
         harness: Harness,
         *,
         session_id: str | None = None,
+        cache_maxsize: int = 0,
+        cache_ttl: float | None = None,
+        defer_post_model: bool = False,
         logger_instance: logging.Logger | None = None,
     ):
         """Initialize the Strands Harness Hook.
@@ -88,12 +93,35 @@ class SonderaHarnessHook(HookProvider):
                      Can be RemoteHarness for production or LocalHarness for testing.
             session_id: Optional session identifier to group trajectories across
                 multiple invocations into a single logical session.
+            cache_maxsize: Number of ``Allow`` verdicts to remember by content
+                fingerprint so repeated prompts, tool calls, and tool results
+                skip the harness round-trip. ``0`` (the default) disables the
+                cache. Cache hits are not recorded on the trajectory, so only
+                enable this when policies are deterministic in event content.
+                Call ``clear_cache()`` after changing policies.
+            cache_ttl: Optional lifetime of a cached verdict in seconds.
+            defer_post_model: Queue post-model adjudications instead of
+                awaiting them. A post-model deny is only logged, never acted
+                on, so nothing waits on the verdict; queued events are sent in
+                the same batch as the next adjudication (or before finalize),
+                saving one round-trip per model call.
             logger_instance: Optional custom logger instance.
         """
         self._harness = harness
         self._session_id = session_id
+        self._cache = (
+            AdjudicationCache(cache_maxsize, cache_ttl) if cache_maxsize > 0 else None
+        )
         self._log = logger_instance or logger
         self._strands_agent: Any | None = None
+        self._defer_post_model = defer_post_model
+        # Deferred post-model (event, cache key) pairs awaiting the next batch.
+        self._pending: list[tuple[Event, bytes]] = []
+        # Rendered conversation lines reused across model calls; see
+        # _conversation_text.
+        self._history_owner: Any | None = None
+        self._history_last: Any | None = None
+        self._history_lines: list[str] = []
 
     # -------------------------------------------------------------------------
     # HookProvider interface - required by Strands
@@ -129,22 +157,30 @@ class SonderaHarnessHook(HookProvider):
             agent = format_strands_agent(event.agent)
             await self._harness.initialize(agent=agent, session_id=self._session_id)
             self._log.debug(
-                f"[SonderaHarness] Initialized trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] Initialized trajectory %s",
+                self._harness.trajectory_id,
             )
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in before_invocation: {e}", exc_info=True
+                "[SonderaHarness] Error in before_invocation: %s",
+                e,
+                exc_info=True,
             )
 
     async def _on_after_invocation(self, event: AfterInvocationEvent) -> None:
         """Callback for AfterInvocationEvent - Finalize trajectory."""
         try:
             trajectory_id = self._harness.trajectory_id
-            await self._harness.finalize()
-            self._log.info(f"[SonderaHarness] Finalized trajectory {trajectory_id}")
+            try:
+                await self._flush_pending()
+            finally:
+                await self._harness.finalize()
+            self._log.info("[SonderaHarness] Finalized trajectory %s", trajectory_id)
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in after_invocation: {e}", exc_info=True
+                "[SonderaHarness] Error in after_invocation: %s",
+                e,
+                exc_info=True,
             )
 
     # -------------------------------------------------------------------------
@@ -160,25 +196,28 @@ class SonderaHarnessHook(HookProvider):
                 )
                 return
 
-            content = self._extract_text_from_event(event)
-            prompt = Prompt(role=PromptRole.User, content=content)
-            harness_event = Event(
-                agent=self._harness.agent,
-                trajectory_id=self._harness.trajectory_id,
-                event=prompt,
+            content = self._before_model_text(event)
+            adjudication = await self._adjudicate(
+                Prompt(role=PromptRole.User, content=content),
+                "prompt",
+                "user",
+                content,
             )
-            adjudication = await self._harness.adjudicate(harness_event)
             self._log.info(
-                f"[SonderaHarness] Before model adjudication for trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] Before model adjudication for trajectory %s",
+                self._harness.trajectory_id,
             )
 
             if adjudication.decision == Decision.Deny:
                 self._log.warning(
-                    f"[SonderaHarness] Model call blocked: {adjudication.reason}"
+                    "[SonderaHarness] Model call blocked: %s",
+                    adjudication.reason,
                 )
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in before_model_call: {e}", exc_info=True
+                "[SonderaHarness] Error in before_model_call: %s",
+                e,
+                exc_info=True,
             )
 
     async def _on_after_model_call(self, event: AfterModelCallEvent) -> None:
@@ -190,28 +229,28 @@ class SonderaHarnessHook(HookProvider):
                 )
                 return
 
-            content = self._extract_text_from_event(event)
+            content = self._after_model_text(event)
             if not content:
                 return
 
-            prompt = Prompt(role=PromptRole.Assistant, content=content)
-            harness_event = Event(
-                agent=self._harness.agent,
-                trajectory_id=self._harness.trajectory_id,
-                event=prompt,
+            payload = Prompt(role=PromptRole.Assistant, content=content)
+            if self._defer_post_model:
+                self._defer(payload, "prompt", "assistant", content)
+                return
+
+            adjudication = await self._adjudicate(
+                payload, "prompt", "assistant", content
             )
-            adjudication = await self._harness.adjudicate(harness_event)
             self._log.info(
-                f"[SonderaHarness] After model adjudication for trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] After model adjudication for trajectory %s",
+                self._harness.trajectory_id,
             )
-
-            if adjudication.decision == Decision.Deny:
-                self._log.warning(
-                    f"[SonderaHarness] Model response blocked: {adjudication.reason}"
-                )
+            self._log_post_model(adjudication)
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in after_model_call: {e}", exc_info=True
+                "[SonderaHarness] Error in after_model_call: %s",
+                e,
+                exc_info=True,
             )
 
     # -------------------------------------------------------------------------
@@ -231,32 +270,33 @@ class SonderaHarnessHook(HookProvider):
             tool_input = event.tool_use.get("input", {})
             tool_use_id = event.tool_use.get("toolUseId", "")
 
-            tool_call = ToolCall(
-                tool=tool_name,
-                arguments=tool_input
-                if isinstance(tool_input, dict)
-                else {"input": tool_input},
-                call_id=tool_use_id,
+            arguments = (
+                tool_input if isinstance(tool_input, dict) else {"input": tool_input}
             )
-            harness_event = Event(
-                agent=self._harness.agent,
-                trajectory_id=self._harness.trajectory_id,
-                event=tool_call,
+            adjudication = await self._adjudicate(
+                ToolCall(tool=tool_name, arguments=arguments, call_id=tool_use_id),
+                "tool_call",
+                tool_name,
+                _canonical_json(arguments),
             )
-            adjudication = await self._harness.adjudicate(harness_event)
             self._log.info(
-                f"[SonderaHarness] Before tool adjudication for trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] Before tool adjudication for trajectory %s",
+                self._harness.trajectory_id,
             )
 
             if adjudication.decision == Decision.Deny:
                 # Cancel the tool call using Strands' cancel_tool mechanism
                 event.cancel_tool = f"Tool blocked by policy: {adjudication.reason}"
                 self._log.warning(
-                    f"[SonderaHarness] Blocked tool '{tool_name}': {adjudication.reason}"
+                    "[SonderaHarness] Blocked tool '%s': %s",
+                    tool_name,
+                    adjudication.reason,
                 )
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in before_tool_call: {e}", exc_info=True
+                "[SonderaHarness] Error in before_tool_call: %s",
+                e,
+                exc_info=True,
             )
 
     async def _on_after_tool_call(self, event: AfterToolCallEvent) -> None:
@@ -268,6 +308,7 @@ class SonderaHarnessHook(HookProvider):
                 )
                 return
 
+            tool_name = event.tool_use.get("name", "unknown")
             tool_use_id = event.tool_use.get("toolUseId", "")
 
             # Determine success/error based on result structure
@@ -286,82 +327,187 @@ class SonderaHarnessHook(HookProvider):
                     call_id=tool_use_id, output=output
                 )
 
-            harness_event = Event(
-                agent=self._harness.agent,
-                trajectory_id=self._harness.trajectory_id,
-                event=tool_output,
+            adjudication = await self._adjudicate(
+                tool_output,
+                "tool_output",
+                tool_name,
+                "error" if is_error else "success",
+                output,
             )
-            adjudication = await self._harness.adjudicate(harness_event)
             self._log.info(
-                f"[SonderaHarness] After tool adjudication for trajectory {self._harness.trajectory_id}"
+                "[SonderaHarness] After tool adjudication for trajectory %s",
+                self._harness.trajectory_id,
             )
 
             if adjudication.decision == Decision.Deny:
                 # Modify the result to indicate policy violation
-                event.result = {
-                    "content": [
-                        {"text": f"Tool result blocked: {adjudication.reason}"}
-                    ],
-                    "status": "error",
-                    "toolUseId": tool_use_id,
-                }
+                event.result = _blocked_tool_result(adjudication.reason, tool_use_id)
                 self._log.warning(
-                    f"[SonderaHarness] Tool result blocked: {adjudication.reason}"
+                    "[SonderaHarness] Tool result blocked: %s",
+                    adjudication.reason,
                 )
         except Exception as e:
             self._log.error(
-                f"[SonderaHarness] Error in after_tool_call: {e}", exc_info=True
+                "[SonderaHarness] Error in after_tool_call: %s",
+                e,
+                exc_info=True,
             )
 
     # -------------------------------------------------------------------------
     # Helper methods
     # -------------------------------------------------------------------------
 
-    def _extract_text_from_event(self, event: Any) -> str:
-        """Extract text content from Strands events for adjudication.
+    def clear_cache(self) -> None:
+        """Drop all cached verdicts, e.g. after policies change."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _make_event(self, payload: Any) -> Event:
+        """Wrap ``payload`` in an Event for the current trajectory."""
+        return Event(
+            agent=self._harness.agent,
+            trajectory_id=self._harness.trajectory_id,
+            event=payload,
+        )
 
-        Args:
-            event: The Strands hook event
+    async def _adjudicate(self, payload: Any, *key_parts: str) -> Adjudicated:
+        """Adjudicate ``payload`` on the current trajectory.
 
-        Returns:
-            Extracted text content for adjudication
+        ``key_parts`` identify the payload's content for the verdict cache;
+        a cached ``Allow`` is returned without calling the harness. Deferred
+        post-model events are sent ahead of it in the same batch.
         """
-        if isinstance(event, BeforeModelCallEvent):
-            try:
-                if (
-                    hasattr(event.agent, "conversation_manager")
-                    and event.agent.conversation_manager
-                ):
-                    messages = []
-                    conv_mgr = event.agent.conversation_manager
-                    messages_attr = getattr(conv_mgr, "messages", None)
-                    if messages_attr:
-                        for msg in messages_attr:
-                            role = (
-                                msg.get("role", "unknown")
-                                if hasattr(msg, "get")
-                                else getattr(msg, "role", "unknown")
-                            )
-                            content = (
-                                msg.get("content", "")
-                                if hasattr(msg, "get")
-                                else getattr(msg, "content", "")
-                            )
-                            messages.append(f"{role}: {content}")
-                    if messages:
-                        return "\n".join(messages)
-            except (AttributeError, TypeError) as e:
-                self._log.debug(f"Could not extract conversation: {e}")
-            return ""
+        cache = self._cache
+        key = cache.key(*key_parts) if cache is not None else b""
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        event = self._make_event(payload)
+        if self._pending:
+            [adjudicated] = await self._send(self._take_pending(), [(event, key)])
+            return adjudicated
+        adjudicated = await self._harness.adjudicate(event)
+        if cache is not None:
+            cache.put(key, adjudicated)
+        return adjudicated
+
+    def _defer(self, payload: Any, *key_parts: str) -> None:
+        """Queue a post-model ``payload`` for the next batch."""
+        cache = self._cache
+        key = cache.key(*key_parts) if cache is not None else b""
+        if cache is not None and cache.get(key) is not None:
+            return
+        self._pending.append((self._make_event(payload), key))
+
+    def _take_pending(self) -> list[tuple[Event, bytes]]:
+        pending, self._pending = self._pending, []
+        return pending
+
+    async def _flush_pending(self) -> None:
+        """Send any deferred post-model events."""
+        if self._pending:
+            await self._send(self._take_pending(), [])
+
+    async def _send(
+        self,
+        deferred: list[tuple[Event, bytes]],
+        live: list[tuple[Event, bytes]],
+    ) -> list[Adjudicated]:
+        """Adjudicate deferred and live ``(event, cache key)`` pairs in one batch.
 
-        if isinstance(event, AfterModelCallEvent):
-            if event.stop_response and event.stop_response.message:
-                content = (
-                    event.stop_response.message.get("content", "")
-                    if hasattr(event.stop_response.message, "get")
-                    else getattr(event.stop_response.message, "content", "")
-                )
-                return str(content)
+        Deferred post-model verdicts are logged here; the verdicts for
+        ``live`` are returned in order.
+        """
+        items = [*deferred, *live]
+        results = await self._harness.adjudicates([event for event, _ in items])
+        cache = self._cache
+        if cache is not None:
+            for (_, key), adjudicated in zip(items, results, strict=True):
+                cache.put(key, adjudicated)
+        for adjudicated in results[: len(deferred)]:
+            self._log_post_model(adjudicated)
+        return results[len(deferred) :]
+
+    def _log_post_model(self, adjudication: Adjudicated) -> None:
+        """Report a post-model verdict; denies are logged, not enforced."""
+        if adjudication.decision == Decision.Deny:
+            self._log.warning(
+                "[SonderaHarness] Model response blocked: %s",
+                adjudication.reason,
+            )
+
+    def _before_model_text(self, event: BeforeModelCallEvent) -> str:
+        """Render the agent's conversation ahead of a model call."""
+        conv_mgr = getattr(getattr(event, "agent", None), "conversation_manager", None)
+        messages = getattr(conv_mgr, "messages", None) if conv_mgr else None
+        if not messages:
             return ""
+        try:
+            return self._conversation_text(conv_mgr, messages)
+        except (AttributeError, TypeError) as e:
+            self._log.debug("Could not extract conversation: %s", e)
+        return ""
 
+    def _after_model_text(self, event: AfterModelCallEvent) -> str:
+        """Return the content of the model's response message."""
+        stop_response = event.stop_response
+        if stop_response and (message := stop_response.message):
+            return str(_field(message, "content", ""))
         return ""
+
+    def _conversation_text(self, owner: Any, messages: Any) -> str:
+        """Render ``messages`` as ``role: content`` lines, one per message.
+
+        Conversations normally only grow between model calls, so the lines
+        rendered last time are reused while the owner is the same and the last
+        message seen is still at its position; only new messages are
+        formatted. Anything else (a new conversation, trimming) re-renders
+        from scratch.
+        """
+        lines = self._history_lines
+        seen = len(lines)
+        if (
+            owner is not self._history_owner
+            or len(messages) < seen
+            or (seen and messages[seen - 1] is not self._history_last)
+        ):
+            lines = []
+            seen = 0
+        new_lines = [_format_message(msg) for msg in messages[seen:]]
+        lines.extend(new_lines)
+        self._history_owner = owner
+        self._history_lines = lines
+        self._history_last = messages[-1]
+        return "\n".join(lines)
+
+
+def _blocked_tool_result(reason: str | None, tool_use_id: str) -> dict[str, Any]:
+    """Build the error tool result that replaces a denied tool output.
+
+    A new dict is returned each time since Strands may mutate the result.
+    """
+    return {
+        "content": [{"text": f"Tool result blocked: {reason}"}],
+        "status": "error",
+        "toolUseId": tool_use_id,
+    }
+
+
+def _format_message(msg: Any) -> str:
+    """Render one conversation message as ``role: content``."""
+    return f"{_field(msg, 'role', 'unknown')}: {_field(msg, 'content', '')}"
+
+
+def _field(obj: Any, name: str, default: Any) -> Any:
+    """Read ``name`` from a mapping-like message or a plain object."""
+    # Strands messages are plain dicts; the exact-type check skips the
+    # hasattr probe for them.
+    if type(obj) is dict or hasattr(obj, "get"):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _canonical_json(value: Any) -> str:
+    """Serialize ``value`` with sorted keys so equal arguments share a cache key."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
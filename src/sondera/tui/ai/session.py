@@ -15,7 +15,8 @@ import logging
 from typing import Any
 
 import sondera.settings as _settings
-from sondera.harness import Harness, SonderaRemoteHarness
+from sondera.harness import Harness
+from sondera.tui.util import remote_harness
 from sondera.types import (
     Adjudicated,
     Agent,
@@ -82,10 +83,7 @@ class AskSession:
         if not _settings.SETTINGS.sondera_api_token:
             return
         try:
-            self._harness = SonderaRemoteHarness(
-                sondera_harness_endpoint=_settings.SETTINGS.sondera_harness_endpoint,
-                sondera_api_key=_settings.SETTINGS.sondera_api_token,
-            )
+            self._harness = remote_harness()
             await self._harness.initialize(agent=_AI_AGENT)
             self._active = True
             _log.debug("AI trajectory started: %s", self._harness.trajectory_id)
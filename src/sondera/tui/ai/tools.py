@@ -6,6 +6,7 @@ providers (Gemini, OpenAI, Anthropic, Ollama, vLLM, etc.).
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import inspect
 import json
@@ -630,9 +631,14 @@ async def _exec_list_violations(
         ]
         if violated_tids:
             step_violations: list[dict[str, Any]] = []
-            for tid in violated_tids[:5]:
-                full = await harness.get_trajectory(tid)
-                if full is None:
+            # Fetch the candidates concurrently; a failed fetch skips that one.
+            violated_tids = violated_tids[:5]
+            fulls = await asyncio.gather(
+                *(harness.get_trajectory(tid) for tid in violated_tids),
+                return_exceptions=True,
+            )
+            for tid, full in zip(violated_tids, fulls, strict=True):
+                if full is None or isinstance(full, BaseException):
                     continue
                 full_agent_id = full.agent
                 a_name = agents_map.get(full_agent_id, full_agent_id[:16])
@@ -1039,23 +1045,29 @@ async def _exec_navigate_to_violation(
     # Strategy 3: Load recent trajectories fully and scan step-level decisions.
     # This catches violations in active/running trajectories where neither
     # list_adjudications nor decision_summary are populated.
+    trajectory = None
     if violated_tid is None and trajectories:
-        try:
-            for t in trajectories[:10]:
-                tid = t.name
-                full = await harness.get_trajectory(tid)
-                if full is None:
-                    continue
-                event_steps = correlate_events(full.events or [])
-                for i, step in enumerate(event_steps):
-                    if step.decision in (Decision.Deny, Decision.Escalate):
-                        violated_tid = tid
-                        initial_step = i
-                        break
-                if violated_tid:
+        # Load the candidates concurrently, then scan them in list order so
+        # the first (most recent) violating trajectory still wins.
+        tids = [t.name for t in trajectories[:10]]
+        fulls = await asyncio.gather(
+            *(harness.get_trajectory(tid) for tid in tids), return_exceptions=True
+        )
+        for tid, full in zip(tids, fulls, strict=True):
+            if isinstance(full, BaseException):
+                errors.append(f"scan: {full}")
+                continue
+            if full is None:
+                continue
+            event_steps = correlate_events(full.events or [])
+            for i, step in enumerate(event_steps):
+                if step.decision in (Decision.Deny, Decision.Escalate):
+                    violated_tid = tid
+                    initial_step = i
+                    trajectory = full
                     break
-        except Exception as e:
-            errors.append(f"scan: {e}")
+            if violated_tid:
+                break
 
     if violated_tid is None:
         msg = f"No violations found for {agent_name}."
@@ -1064,7 +1076,8 @@ async def _exec_navigate_to_violation(
         return {"error": msg}
 
     # Fetch full trajectory (may already have it from strategy 3)
-    trajectory = await harness.get_trajectory(violated_tid)
+    if trajectory is None:
+        trajectory = await harness.get_trajectory(violated_tid)
     if trajectory is None:
         return {"error": f"Could not load trajectory {violated_tid}."}
 
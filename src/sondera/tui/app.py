@@ -2,7 +2,7 @@ import asyncio
 import contextlib
 import json
 import time
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,20 +12,34 @@ from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.screen import Screen
 from textual.theme import Theme
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 
 import sondera.settings as _settings
-from sondera.harness import Harness, SonderaRemoteHarness
+from sondera.harness import Harness
 from sondera.tui.ai.panel import AskInput, AskPanel, AskSessionState
 from sondera.tui.colors import ThemeColors, get_theme_colors
-from sondera.tui.events import correlate_events, parse_ts, violations_from_events
+from sondera.tui.events import (
+    ViolationRecord,
+    correlate_events,
+    parse_ts,
+    violations_from_events,
+)
 from sondera.tui.mixins import SectionNavMixin
 from sondera.tui.screens import AgentScreen, TrajectoryScreen
+from sondera.tui.util import remote_harness
 from sondera.tui.widgets.agents_feed import AgentsFeed, AgentStatus
 from sondera.tui.widgets.dashboard_header import DashboardHeader
 from sondera.tui.widgets.trajectory_feed import _is_stale
 from sondera.tui.widgets.violations_feed import ViolationsFeed
-from sondera.types import Adjudicated, Agent, Decision, Event, TrajectoryEventStream
+from sondera.types import (
+    Adjudicated,
+    Agent,
+    Decision,
+    Event,
+    Trajectory,
+    TrajectoryEventStream,
+)
 
 
 def _agent_id(agent: Agent | str | None) -> str:
@@ -90,20 +104,38 @@ def _compute_agent_status(
     denied_traj_count: int,
     awaiting_count: int,
     has_more_trajectories: bool = False,
+    trajectory_times: dict[str, datetime] | None = None,
 ) -> AgentStatus:
-    """Derive an AgentStatus from a trajectory list and pre-computed violation counts."""
-    running = sum(
-        1
-        for t in trajectories
-        if str(t.status or "unknown").lower() in {"running", "pending"}
-        and not _is_stale(t)
-    )
-    failed = sum(
-        1 for t in trajectories if str(t.status or "unknown").lower() == "failed"
-    )
-    completed = sum(
-        1 for t in trajectories if str(t.status or "unknown").lower() == "completed"
-    )
+    """Derive an AgentStatus from a trajectory list and pre-computed violation counts.
+
+    When ``trajectory_times`` is given, each trajectory's last activity time is
+    recorded in it by name during the same pass.
+    """
+    # One pass: normalise each status once, tally it, and track the most
+    # recent activity and the latest-updated trajectory.
+    running = failed = completed = 0
+    last_active: datetime | None = None
+    latest = None
+    latest_status = ""
+    latest_update: datetime | None = None
+    for t in trajectories:
+        ts = str(t.status or "unknown").lower()
+        if ts in {"running", "pending"}:
+            if not _is_stale(t):
+                running += 1
+        elif ts == "failed":
+            failed += 1
+        elif ts == "completed":
+            completed += 1
+        updated = parse_ts(t.update_time)
+        active = max(updated, parse_ts(t.create_time))
+        if trajectory_times is not None:
+            trajectory_times[t.name] = active
+        if last_active is None or active > last_active:
+            last_active = active
+        if latest_update is None or updated > latest_update:
+            latest, latest_status, latest_update = t, ts, updated
+
     if running > 0:
         status = "live"
     elif failed > 0:
@@ -112,19 +144,12 @@ def _compute_agent_status(
         status = "idle"
     else:
         status = "off"
-    last_active = max(
-        (max(parse_ts(t.update_time), parse_ts(t.create_time)) for t in trajectories),
-        default=None,
-    )
-    sorted_trajs = sorted(
-        trajectories, key=lambda t: parse_ts(t.update_time), reverse=True
-    )
     last_traj_status = None
-    if sorted_trajs:
-        latest = sorted_trajs[0]
-        ls = str(latest.status or "unknown").lower()
+    if latest is not None:
         last_traj_status = (
-            "stale" if ls in {"running", "pending"} and _is_stale(latest) else ls
+            "stale"
+            if latest_status in {"running", "pending"} and _is_stale(latest)
+            else latest_status
         )
     return AgentStatus(
         agent=agent,
@@ -142,6 +167,12 @@ def _compute_agent_status(
     )
 
 
+def _set_decision_counts(header: DashboardHeader, counts: Counter[Decision]) -> None:
+    """Set the header's deny/escalate counts."""
+    header.violation_count = counts[Decision.Deny]
+    header.awaiting_count = counts[Decision.Escalate]
+
+
 class SonderaApp(SectionNavMixin, App):
     """Mission Control dashboard for Sondera governance monitoring."""
 
@@ -180,26 +211,41 @@ class SonderaApp(SectionNavMixin, App):
         self._agents_map: dict[str, str] = {}
         self._adjudications: list = []
         self._seen_adj_ids: set[str] = set()
+        # Violation records and counts folded in as adjudications arrive
+        # (see _tally_adjudications), so new events never rescan the history.
+        self._violation_records: list[ViolationRecord] = []
+        self._decision_counts: Counter[Decision] = Counter()
+        self._agent_denied: Counter[str] = Counter()
+        self._agent_awaiting: Counter[str] = Counter()
+        self._agent_denied_trajectories: defaultdict[str, set[str]] = defaultdict(set)
         self._agent_statuses: list = []
         self._agents_by_id: dict = {}
         self._ask_state = AskSessionState()
         self._last_activity = time.monotonic()
+        # Dashboard sections resolved once and reused by keyboard navigation.
+        self._dashboard_sections: tuple[ViolationsFeed, AgentsFeed, AskPanel] | None
+        self._dashboard_sections = None
 
         # Harness is created lazily on first use to avoid blocking the
         # constructor with an eager gRPC connection attempt.
         self._harness: Harness | None = None
+        # Shared get_trajectory fetches keyed by trajectory ID (see
+        # get_trajectory_cached).
+        self._trajectory_fetches: dict[str, asyncio.Future[Trajectory | None]] = {}
+        self._prefetch_timer: Timer | None = None
 
     PAGE_SIZE = 20
+    # Adjudications are fetched in small pages so the violations feed paints
+    # after the first round trip; later pages fill it in up to the cap.
+    ADJUDICATION_PAGE_SIZE = 50
+    ADJUDICATION_LIMIT = 250
     _grpc_sem: asyncio.Semaphore | None = None
 
     @property
     def harness(self) -> Harness:
         """Lazily create the harness on first access."""
         if self._harness is None:
-            self._harness = SonderaRemoteHarness(
-                sondera_harness_endpoint=_settings.SETTINGS.sondera_harness_endpoint,
-                sondera_api_key=_settings.SETTINGS.sondera_api_token,
-            )
+            self._harness = remote_harness()
         return self._harness
 
     @property
@@ -212,6 +258,54 @@ class SonderaApp(SectionNavMixin, App):
         async with self._semaphore:
             return await coro
 
+    TRAJECTORY_CACHE_SIZE = 32
+    # Seconds the violations cursor must rest on a row before its
+    # trajectory is prefetched, so scrolling through rows queues no RPCs.
+    PREFETCH_DELAY = 0.3
+
+    async def get_trajectory_cached(self, trajectory_id: str) -> Trajectory | None:
+        """``get_trajectory`` that shares fetches and keeps finished trajectories.
+
+        Concurrent callers for the same ID await one request. Completed and
+        failed trajectories stay cached so reopening them is instant; anything
+        still running is refetched next time. The dashboard stream drops an
+        entry whenever its trajectory changes, and refresh clears them all.
+        """
+        # Shield the shared fetch so one caller's cancellation spares the rest.
+        return await asyncio.shield(self._trajectory_fetch(trajectory_id))
+
+    def _trajectory_fetch(
+        self, trajectory_id: str
+    ) -> asyncio.Future[Trajectory | None]:
+        """Return the shared fetch for ``trajectory_id``, starting it if needed."""
+        fetch = self._trajectory_fetches.get(trajectory_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(
+                self._throttled(self.harness.get_trajectory(trajectory_id))
+            )
+            self._trajectory_fetches[trajectory_id] = fetch
+            fetch.add_done_callback(
+                lambda f: self._settle_trajectory_fetch(trajectory_id, f)
+            )
+            while len(self._trajectory_fetches) > self.TRAJECTORY_CACHE_SIZE:
+                del self._trajectory_fetches[next(iter(self._trajectory_fetches))]
+        return fetch
+
+    def _settle_trajectory_fetch(
+        self, trajectory_id: str, fetch: asyncio.Future[Trajectory | None]
+    ) -> None:
+        """Keep a finished fetch only if it holds a terminal trajectory."""
+        # Reading the exception first marks it retrieved, so a prefetch nobody
+        # awaited does not log "exception was never retrieved".
+        trajectory = (
+            None if fetch.cancelled() or fetch.exception() else fetch.result()
+        )
+        if self._trajectory_fetches.get(trajectory_id) is not fetch:
+            return
+        status = str(trajectory.status or "").lower() if trajectory else ""
+        if status not in {"completed", "failed"}:
+            del self._trajectory_fetches[trajectory_id]
+
     @property
     def theme_colors(self) -> ThemeColors:
         """Return the semantic color palette for the active theme."""
@@ -325,7 +419,11 @@ class SonderaApp(SectionNavMixin, App):
         try:
             agents_result, adj_result = await asyncio.gather(
                 self._throttled(self.harness.list_agents(page_size=250)),
-                self._throttled(self.harness.list_adjudications(page_size=250)),
+                self._throttled(
+                    self.harness.list_adjudications(
+                        page_size=self.ADJUDICATION_PAGE_SIZE
+                    )
+                ),
             )
         except Exception as e:
             self.notify(f"{e}", severity="error", timeout=5)
@@ -341,7 +439,7 @@ class SonderaApp(SectionNavMixin, App):
         except Exception:
             pass
 
-        adj_events, _adj_next = adj_result
+        adj_events, adj_next = adj_result
 
         agents_map = {agent.id: agent.id for agent in agents}
         self._agents = agents
@@ -351,7 +449,13 @@ class SonderaApp(SectionNavMixin, App):
         self._seen_adj_ids = {ev.event_id for ev in adj_events if ev.event_id}
 
         # Build violation records from adjudication events
-        violation_records = violations_from_events(adj_events)
+        self._violation_records = []
+        self._decision_counts.clear()
+        self._agent_denied.clear()
+        self._agent_awaiting.clear()
+        self._agent_denied_trajectories.clear()
+        self._tally_adjudications(adj_events)
+        violation_records = self._violation_records
 
         # Update violations feed
         violations_feed = self.query_one(ViolationsFeed)
@@ -360,12 +464,7 @@ class SonderaApp(SectionNavMixin, App):
 
         # Update header counts
         header = self.query_one(DashboardHeader)
-        header.violation_count = sum(
-            1 for v in violation_records if v.decision == Decision.Deny
-        )
-        header.awaiting_count = sum(
-            1 for v in violation_records if v.decision == Decision.Escalate
-        )
+        _set_decision_counts(header, self._decision_counts)
         header.total_agents = len(agents)
 
         # Auto-focus the most relevant feed
@@ -379,6 +478,79 @@ class SonderaApp(SectionNavMixin, App):
         # Phase 2: Trajectories in background (for agent status)
         self._load_trajectories()
 
+        # Remaining adjudication pages, rendered as each one arrives alongside
+        # phase 2; their per-agent counts are folded into the agent rows.
+        await self._load_more_adjudications(adj_next)
+
+    async def _load_more_adjudications(self, page_token: str) -> None:
+        """Fetch further adjudication pages up to ``ADJUDICATION_LIMIT``."""
+        while page_token and len(self._adjudications) < self.ADJUDICATION_LIMIT:
+            try:
+                page, page_token = await self._throttled(
+                    self.harness.list_adjudications(
+                        page_size=self.ADJUDICATION_PAGE_SIZE,
+                        page_token=page_token,
+                    )
+                )
+            except Exception:
+                return
+            added: list[Event] = []
+            for ev in page:
+                event_id = ev.event_id or ""
+                if event_id and event_id in self._seen_adj_ids:
+                    continue
+                if event_id:
+                    self._seen_adj_ids.add(event_id)
+                self._adjudications.append(ev)
+                added.append(ev)
+            if added:
+                self._tally_adjudications(added)
+                self._render_violations()
+                self._render_agent_tallies()
+
+    def _tally_adjudications(self, events: list[Event]) -> None:
+        """Fold events just appended to ``_adjudications`` into the tallies."""
+        start = len(self._adjudications) - len(events)
+        for record in violations_from_events(events, start=start):
+            self._violation_records.append(record)
+            self._decision_counts[record.decision] += 1
+            if record.decision == Decision.Deny:
+                self._agent_denied[record.agent_id] += 1
+                self._agent_denied_trajectories[record.agent_id].add(
+                    record.trajectory_id
+                )
+            else:
+                self._agent_awaiting[record.agent_id] += 1
+
+    def _fold_agent_tallies(self) -> int:
+        """Copy per-agent adjudication tallies onto the agent rows.
+
+        Returns the number of agents with denied or awaiting adjudications.
+        """
+        problem_agent_count = 0
+        for a in self._agent_statuses:
+            agent_id = a.agent.id
+            a.denied_count = self._agent_denied[agent_id]
+            a.denied_trajectory_count = len(
+                self._agent_denied_trajectories.get(agent_id, ())
+            )
+            a.awaiting_count = self._agent_awaiting[agent_id]
+            if a.denied_count > 0 or a.awaiting_count > 0:
+                problem_agent_count += 1
+        return problem_agent_count
+
+    def _render_agent_tallies(self) -> None:
+        """Refresh the agent rows after later adjudication pages arrive."""
+        if not self._agent_statuses:
+            return  # Phase 2 folds the tallies in when it renders
+        problem_agent_count = self._fold_agent_tallies()
+        with self.batch_update():
+            with contextlib.suppress(Exception):
+                self.query_one(AgentsFeed).agents = self._agent_statuses
+            with contextlib.suppress(Exception):
+                header = self.query_one(DashboardHeader)
+                header.problem_agent_count = problem_agent_count
+
     @work(exclusive=True, group="load-trajectories")
     async def _load_trajectories(self) -> None:
         """Fetch trajectories for all agents, then render the agents feed once."""
@@ -400,32 +572,16 @@ class SonderaApp(SectionNavMixin, App):
 
         all_trajectories = []
 
-        # Build per-agent denied/awaiting counts from adjudication Events
-        agent_denied: Counter[str] = Counter()
-        agent_awaiting: Counter[str] = Counter()
-        agent_denied_trajectories: dict[str, set[str]] = {}
-        for adj_ev in self._adjudications:
-            adj_payload = adj_ev.event  # Adjudicated
-            agent_aid = _agent_id(adj_ev.agent)
-            traj_tid = adj_ev.trajectory_id or ""
-            if (
-                isinstance(adj_payload, Adjudicated)
-                and adj_payload.decision == Decision.Deny
-            ):
-                agent_denied[agent_aid] += 1
-                agent_denied_trajectories.setdefault(agent_aid, set()).add(traj_tid)
-            elif (
-                isinstance(adj_payload, Adjudicated)
-                and adj_payload.decision == Decision.Escalate
-            ):
-                agent_awaiting[agent_aid] += 1
+        # Per-agent denied/awaiting counts, tallied as adjudications arrived
+        agent_denied = self._agent_denied
+        agent_awaiting = self._agent_awaiting
+        agent_denied_trajectories = self._agent_denied_trajectories
 
         # Build trajectory timestamp map for violations feed
         trajectory_times: dict[str, datetime] = {}
 
         agent_statuses: list[AgentStatus] = []
         live_count = 0
-        problem_agent_count = 0
 
         for agent, result in zip(agents, first_results, strict=True):
             denied = agent_denied[agent.id]
@@ -433,8 +589,6 @@ class SonderaApp(SectionNavMixin, App):
             denied_traj_count = len(agent_denied_trajectories.get(agent.id, set()))
 
             if isinstance(result, BaseException):
-                if denied > 0 or awaiting > 0:
-                    problem_agent_count += 1
                 agent_statuses.append(
                     _compute_agent_status(
                         agent=agent,
@@ -449,15 +603,6 @@ class SonderaApp(SectionNavMixin, App):
             trajectories, next_token = result
             all_trajectories.extend(trajectories)
 
-            # Build trajectory time map
-            for t in trajectories:
-                trajectory_times[t.name] = max(
-                    parse_ts(t.update_time), parse_ts(t.create_time)
-                )
-
-            if denied > 0 or awaiting > 0:
-                problem_agent_count += 1
-
             a_status = _compute_agent_status(
                 agent=agent,
                 trajectories=trajectories,
@@ -465,6 +610,7 @@ class SonderaApp(SectionNavMixin, App):
                 denied_traj_count=denied_traj_count,
                 awaiting_count=awaiting,
                 has_more_trajectories=bool(next_token),
+                trajectory_times=trajectory_times,
             )
             if a_status.status == "live":
                 live_count += 1
@@ -504,8 +650,10 @@ class SonderaApp(SectionNavMixin, App):
         _epoch = datetime(2000, 1, 1, tzinfo=UTC)
         agent_statuses.sort(key=lambda a: -(a.last_active or _epoch).timestamp())
 
-        # Store for context extraction (AI Assist)
+        # Store for context extraction (AI Assist). Adjudication pages that
+        # landed while trajectories loaded are folded in before rendering.
         self._agent_statuses = agent_statuses
+        problem_agent_count = self._fold_agent_tallies()
 
         # Single update: render agents feed once with all data
         agents_feed = self.query_one(AgentsFeed)
@@ -540,6 +688,7 @@ class SonderaApp(SectionNavMixin, App):
             traj_id = notification.trajectory_id  # type: ignore[union-attr]
             if not traj_id:
                 continue
+            self._trajectory_fetches.pop(traj_id, None)
             event = notification.event  # type: ignore[union-attr]
             if event is not None:
                 self._ingest_adjudication(event)
@@ -556,18 +705,21 @@ class SonderaApp(SectionNavMixin, App):
             return
         self._seen_adj_ids.add(event_id)
         self._adjudications.append(event)
-
-        violation_records = violations_from_events(self._adjudications)
-        with contextlib.suppress(Exception):
-            self.query_one(ViolationsFeed).violations = violation_records
-        with contextlib.suppress(Exception):
-            header = self.query_one(DashboardHeader)
-            header.violation_count = sum(
-                1 for v in violation_records if v.decision == Decision.Deny
-            )
-            header.awaiting_count = sum(
-                1 for v in violation_records if v.decision == Decision.Escalate
-            )
+        self._tally_adjudications([event])
+        self._render_violations()
+
+    def _render_violations(self) -> None:
+        """Push the tallied violation records and counts to the UI."""
+        # The feed reads the app's record list in place (its reactive always
+        # fires), so an appended adjudication costs no copy of the history.
+        # Feed and header repaint together rather than one after the other.
+        with self.batch_update():
+            with contextlib.suppress(Exception):
+                self.query_one(ViolationsFeed).violations = self._violation_records
+            with contextlib.suppress(Exception):
+                _set_decision_counts(
+                    self.query_one(DashboardHeader), self._decision_counts
+                )
 
     async def _refresh_agent_from_trajectory(self, traj_id: str) -> None:
         """Fetch one trajectory, upsert it, and recompute its agent's dashboard row."""
@@ -597,72 +749,95 @@ class SonderaApp(SectionNavMixin, App):
             t for t in self._all_trajectories if _agent_id(t.agent) == agent_id
         ]
 
-        # Per-agent violation counts from current adjudications
-        denied_count = 0
-        denied_traj_ids: set[str] = set()
-        awaiting_count = 0
-        for adj_ev in self._adjudications:
-            if _agent_id(adj_ev.agent) != agent_id:
-                continue
-            adj_payload = adj_ev.event
-            if isinstance(adj_payload, Adjudicated):
-                if adj_payload.decision == Decision.Deny:
-                    denied_count += 1
-                    denied_traj_ids.add(adj_ev.trajectory_id or "")
-                elif adj_payload.decision == Decision.Escalate:
-                    awaiting_count += 1
+        # Per-agent violation counts from the running tallies
+        denied_count = self._agent_denied[agent_id]
+        denied_traj_ids = self._agent_denied_trajectories.get(agent_id, set())
+        awaiting_count = self._agent_awaiting[agent_id]
 
-        with contextlib.suppress(Exception):
-            agents_feed = self.query_one(AgentsFeed)
-            current = list(agents_feed.agents)
-            has_more = next(
-                (a.has_more_trajectories for a in current if a.agent.id == agent_id),
-                False,
-            )
-            new_status = _compute_agent_status(
-                agent=agent,
-                trajectories=agent_trajectories,
-                denied_count=denied_count,
-                denied_traj_count=len(denied_traj_ids),
-                awaiting_count=awaiting_count,
-                has_more_trajectories=has_more,
-            )
-            for i, a in enumerate(current):
-                if a.agent.id == agent_id:
-                    current[i] = new_status
-                    break
-            else:
-                current.append(new_status)
-            _epoch = datetime(2000, 1, 1, tzinfo=UTC)
-            current.sort(key=lambda a: -(a.last_active or _epoch).timestamp())
-            agents_feed.agents = current
-
-            header = self.query_one(DashboardHeader)
-            header.live_count = sum(1 for a in current if a.status == "live")
-            header.problem_agent_count = sum(
-                1 for a in current if a.denied_count > 0 or a.awaiting_count > 0
-            )
-            self._agent_statuses = current
+        # One repaint for the agents feed, header and violation times.
+        with self.batch_update():
+            with contextlib.suppress(Exception):
+                agents_feed = self.query_one(AgentsFeed)
+                current = list(agents_feed.agents)
+                has_more = next(
+                    (
+                        a.has_more_trajectories
+                        for a in current
+                        if a.agent.id == agent_id
+                    ),
+                    False,
+                )
+                new_status = _compute_agent_status(
+                    agent=agent,
+                    trajectories=agent_trajectories,
+                    denied_count=denied_count,
+                    denied_traj_count=len(denied_traj_ids),
+                    awaiting_count=awaiting_count,
+                    has_more_trajectories=has_more,
+                )
+                for i, a in enumerate(current):
+                    if a.agent.id == agent_id:
+                        current[i] = new_status
+                        break
+                else:
+                    current.append(new_status)
+                _epoch = datetime(2000, 1, 1, tzinfo=UTC)
+                current.sort(key=lambda a: -(a.last_active or _epoch).timestamp())
+                agents_feed.agents = current
+
+                header = self.query_one(DashboardHeader)
+                header.live_count = sum(1 for a in current if a.status == "live")
+                header.problem_agent_count = sum(
+                    1 for a in current if a.denied_count > 0 or a.awaiting_count > 0
+                )
+                self._agent_statuses = current
 
-        # Update trajectory timestamps for the violations feed
-        with contextlib.suppress(Exception):
-            violations_feed = self.query_one(ViolationsFeed)
-            times = dict(violations_feed.trajectory_times)
-            for t in agent_trajectories:
-                times[t.name] = max(parse_ts(t.update_time), parse_ts(t.create_time))
-            violations_feed.trajectory_times = times
+            # Update trajectory timestamps for the violations feed
+            with contextlib.suppress(Exception):
+                violations_feed = self.query_one(ViolationsFeed)
+                times = dict(violations_feed.trajectory_times)
+                for t in agent_trajectories:
+                    times[t.name] = max(
+                        parse_ts(t.update_time), parse_ts(t.create_time)
+                    )
+                violations_feed.trajectory_times = times
 
     # -- Navigation handlers --
 
     def on_violations_feed_violation_selected(
         self, msg: ViolationsFeed.ViolationSelected
     ) -> None:
+        # Opening starts the fetch itself; a pending prefetch is redundant.
+        self._cancel_prefetch()
         self._open_trajectory(
             msg.record.trajectory_id,
             jump_to_decision=msg.record.decision,
             step_index=msg.record.step_index,
         )
 
+    def on_violations_feed_violation_highlighted(
+        self, msg: ViolationsFeed.ViolationHighlighted
+    ) -> None:
+        # Start loading the trajectory while the user reads the row; opening
+        # it then awaits the shared fetch instead of a fresh round trip.
+        self._cancel_prefetch()
+        trajectory_id = msg.record.trajectory_id
+        if not trajectory_id:
+            return
+        self._prefetch_timer = self.set_timer(
+            self.PREFETCH_DELAY, lambda: self._prefetch_trajectory(trajectory_id)
+        )
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+
+    def _prefetch_trajectory(self, trajectory_id: str) -> None:
+        """Start the shared fetch for ``trajectory_id`` without awaiting it."""
+        self._prefetch_timer = None
+        self._trajectory_fetch(trajectory_id)
+
     def on_violations_feed_agent_jump_requested(
         self, msg: ViolationsFeed.AgentJumpRequested
     ) -> None:
@@ -732,10 +907,7 @@ class SonderaApp(SectionNavMixin, App):
     def _on_config_result(self, changed: bool | None) -> None:
         """Reinitialize harness if config was saved."""
         if changed:
-            self._harness = SonderaRemoteHarness(
-                sondera_harness_endpoint=_settings.SETTINGS.sondera_harness_endpoint,
-                sondera_api_key=_settings.SETTINGS.sondera_api_token,
-            )
+            self._harness = remote_harness()
             self._bump_activity()  # Reset idle timer with new timeout
             self.update_dataset()
             self.notify("Configuration saved", timeout=3)
@@ -743,6 +915,7 @@ class SonderaApp(SectionNavMixin, App):
     def action_refresh(self) -> None:
         """Re-fetch all dashboard data and restart the live stream."""
         self._bump_activity()
+        self._trajectory_fetches.clear()
         self.update_dataset()
 
     def action_screensaver(self) -> None:
@@ -758,16 +931,31 @@ class SonderaApp(SectionNavMixin, App):
         while len(self.screen_stack) > 1:
             self.pop_screen()
 
+    def _dashboard_widgets(self) -> tuple[ViolationsFeed, AgentsFeed, AskPanel] | None:
+        """Return the dashboard feeds and ask panel, or None off the dashboard.
+
+        The widgets live for the lifetime of the app, so they are looked up
+        once instead of walking the DOM on every keypress. Pushed screens
+        (agent/trajectory details, screensaver) hide them, so nothing is
+        returned while one of those is active.
+        """
+        if len(self.screen_stack) > 1:
+            return None
+        if self._dashboard_sections is None:
+            try:
+                self._dashboard_sections = (
+                    self.query_one(ViolationsFeed),
+                    self.query_one(AgentsFeed),
+                    self.query_one("#ask-panel", AskPanel),
+                )
+            except Exception:
+                return None
+        return self._dashboard_sections
+
     def _section_cycle(self) -> list:
         """Return the ordered list of focusable sections."""
-        sections = []
-        with contextlib.suppress(Exception):
-            sections.append(self.query_one(ViolationsFeed))
-        with contextlib.suppress(Exception):
-            sections.append(self.query_one(AgentsFeed))
-        with contextlib.suppress(Exception):
-            sections.append(self.query_one("#ask-panel", AskPanel))
-        return sections
+        widgets = self._dashboard_widgets()
+        return list(widgets) if widgets is not None else []
 
     def _on_section_change(self) -> None:
         self._bump_activity()
@@ -819,22 +1007,20 @@ class SonderaApp(SectionNavMixin, App):
 
     def _focused_feed(self) -> ViolationsFeed | AgentsFeed | None:
         """Return whichever feed widget currently has focus."""
-        for cls in (ViolationsFeed, AgentsFeed):
-            with contextlib.suppress(Exception):
-                w = self.query_one(cls)
-                if w.has_focus or w.has_focus_within:
-                    return w
+        widgets = self._dashboard_widgets()
+        if widgets is None:
+            return None
+        vf, af, _panel = widgets
+        for w in (vf, af):
+            if w.has_focus or w.has_focus_within:
+                return w
         # Fallback: focus and return the first feed with content
-        with contextlib.suppress(Exception):
-            vf = self.query_one(ViolationsFeed)
-            if vf.violations:
-                vf.focus()
-                return vf
-        with contextlib.suppress(Exception):
-            af = self.query_one(AgentsFeed)
-            if af.agents:
-                af.focus()
-                return af
+        if vf.violations:
+            vf.focus()
+            return vf
+        if af.agents:
+            af.focus()
+            return af
         return None
 
     def action_cursor_down(self) -> None:
@@ -889,9 +1075,7 @@ class SonderaApp(SectionNavMixin, App):
     ) -> None:
         """Fetch full trajectory details and open the trajectory screen."""
         try:
-            trajectory = await self._throttled(
-                self.harness.get_trajectory(trajectory_id)
-            )
+            trajectory = await self.get_trajectory_cached(trajectory_id)
             if trajectory:
                 initial_step = None
                 if step_index is not None:
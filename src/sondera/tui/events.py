@@ -335,7 +335,7 @@ def correlate_events(events: list[Event]) -> list[EventStep]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ViolationRecord:
     """Display-friendly violation record built from an adjudication Event."""
 
@@ -348,10 +348,15 @@ class ViolationRecord:
     step_index: int | None = None
 
 
-def violations_from_events(events: list[Event]) -> list[ViolationRecord]:
-    """Build ViolationRecords from Events wrapping Adjudicated payloads."""
+def violations_from_events(
+    events: list[Event], start: int = 0
+) -> list[ViolationRecord]:
+    """Build ViolationRecords from Events wrapping Adjudicated payloads.
+
+    ``start`` offsets ``step_index`` when *events* continue a longer list.
+    """
     records: list[ViolationRecord] = []
-    for i, ev in enumerate(events):
+    for i, ev in enumerate(events, start):
         if not isinstance(ev.event, Adjudicated):
             continue
         adj = ev.event
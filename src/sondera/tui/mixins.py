@@ -24,16 +24,31 @@ class SectionNavMixin:
         else:
             section.focus()  # type: ignore[union-attr]
 
+    def _current_section_index(self, sections: list) -> int | None:
+        """Index of the section containing the focused widget, if any.
+
+        Walks the focused widget's ancestors once against an identity map
+        rather than asking every section whether focus is within it.
+        """
+        index = {id(section): i for i, section in enumerate(sections)}
+        node = getattr(self, "focused", None)
+        while node is not None:
+            i = index.get(id(node))
+            if i is not None:
+                return i
+            node = node.parent
+        return None
+
     def _cycle_section(self, direction: int) -> None:
         self._on_section_change()
         sections = self._section_cycle()
         if not sections:
             return
-        for i, section in enumerate(sections):
-            if section.has_focus or section.has_focus_within:
-                self._focus_section(sections[(i + direction) % len(sections)])
-                return
-        self._focus_section(sections[0] if direction > 0 else sections[-1])
+        i = self._current_section_index(sections)
+        if i is not None:
+            self._focus_section(sections[(i + direction) % len(sections)])
+        else:
+            self._focus_section(sections[0] if direction > 0 else sections[-1])
 
     def action_next_section(self) -> None:
         self._cycle_section(1)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from functools import cached_property
 
 from rich.text import Text
 from textual import work
@@ -60,7 +61,7 @@ class AgentScreen(SectionNavMixin, Screen):
         """Cancel AI stream if active, otherwise pop screen."""
         if self.app._ask_state.stream.is_streaming:
             with contextlib.suppress(Exception):
-                self.query_one("#ask-panel", AskPanel).cancel_stream()
+                self._ask_panel.cancel_stream()
             return
         self.app.pop_screen()
 
@@ -79,7 +80,7 @@ class AgentScreen(SectionNavMixin, Screen):
         else:
             self._status_filter = name
         self._apply_filter()
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
+        feed = self._feed
         feed.filter_label = self._status_filter or ""
         self._show_page(1)
 
@@ -156,6 +157,21 @@ class AgentScreen(SectionNavMixin, Screen):
         yield AskPanel(id="ask-panel")
         yield Footer()
 
+    # Widgets composed above live as long as the screen; resolve each once
+    # instead of walking the DOM on every keypress.
+
+    @cached_property
+    def _feed(self) -> TrajectoryFeed:
+        return self.query_one("#trajectory-feed", TrajectoryFeed)
+
+    @cached_property
+    def _pagination_bar(self) -> PaginationBar:
+        return self._feed.query_one("#trajectories-pagination", PaginationBar)
+
+    @cached_property
+    def _ask_panel(self) -> AskPanel:
+        return self.query_one("#ask-panel", AskPanel)
+
     def _render_summary(self) -> Text:
         """Render the agent summary: compact 2-row layout, expandable detail."""
         c = get_theme_colors(self.app)
@@ -206,18 +222,17 @@ class AgentScreen(SectionNavMixin, Screen):
         """Re-render all Rich Text content with current theme colors."""
         self._update_summary()
         try:
-            feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-            feed._rebuild()
+            self._feed._rebuild()
         except Exception:
             pass
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel)._recolor()
+            self._ask_panel._recolor()
 
     def on_mount(self) -> None:
         """Initialize the screen."""
         self.sub_title = f"Agent: {self.agent.id}"
         self._update_summary()
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
+        feed = self._feed
         feed.denied_count = self._denied_count
         feed.awaiting_count = self._awaiting_count
         feed.focus()
@@ -227,7 +242,7 @@ class AgentScreen(SectionNavMixin, Screen):
         from sondera.tui.ai.panel import AskPanel
 
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel).refresh_suggestion()
+            self._ask_panel.refresh_suggestion()
 
     @work(exclusive=True, group="agent-detail-fetch")
     async def _fetch_full_agent(self) -> None:
@@ -297,10 +312,10 @@ class AgentScreen(SectionNavMixin, Screen):
         global_indices = self._display_to_global[start:end]
 
         self.trajectories = page_slice
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
+        feed = self._feed
         feed.trajectories = page_slice
 
-        bar = feed.query_one("#trajectories-pagination", PaginationBar)
+        bar = self._pagination_bar
         bar.set_total_items(total)
         bar.set_client_page(page, total_pages)
 
@@ -343,9 +358,7 @@ class AgentScreen(SectionNavMixin, Screen):
                 return
 
             try:
-                result = await self.app._throttled(
-                    self.app.harness.get_trajectory(traj.name)
-                )
+                result = await self.app.get_trajectory_cached(traj.name)
                 if worker.is_cancelled:
                     return
                 if result:
@@ -428,7 +441,7 @@ class AgentScreen(SectionNavMixin, Screen):
             self._update_summary()
 
             try:
-                feed = self.query_one("#trajectory-feed", TrajectoryFeed)
+                feed = self._feed
             except Exception:
                 continue
 
@@ -447,8 +460,7 @@ class AgentScreen(SectionNavMixin, Screen):
     def action_refresh(self) -> None:
         """Re-fetch trajectories and restart the live stream."""
         try:
-            feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-            feed.query_one("#trajectories-pagination", PaginationBar).reset()
+            self._pagination_bar.reset()
         except Exception:
             pass
         self.load_trajectories()
@@ -467,7 +479,7 @@ class AgentScreen(SectionNavMixin, Screen):
 
     def action_select_trajectory(self) -> None:
         """Select the current trajectory and push TrajectoryScreen."""
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
+        feed = self._feed
         trajectory = feed.get_selected_trajectory()
         if trajectory is None:
             self.notify("No trajectory selected")
@@ -485,7 +497,7 @@ class AgentScreen(SectionNavMixin, Screen):
     async def _open_trajectory(self, trajectory_id: str) -> None:
         """Fetch full trajectory on-demand (fallback before enrichment completes)."""
         try:
-            traj = await self.app.harness.get_trajectory(trajectory_id)
+            traj = await self.app.get_trajectory_cached(trajectory_id)
             if traj:
                 initial = self._first_denied_step(traj)
                 self.app.push_screen(TrajectoryScreen(traj, initial_step=initial))
@@ -511,8 +523,7 @@ class AgentScreen(SectionNavMixin, Screen):
 
     def action_page_next(self) -> None:
         try:
-            feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-            bar = feed.query_one("#trajectories-pagination", PaginationBar)
+            bar = self._pagination_bar
             if bar.has_next:
                 bar._go_next()
         except Exception:
@@ -520,8 +531,7 @@ class AgentScreen(SectionNavMixin, Screen):
 
     def action_page_prev(self) -> None:
         try:
-            feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-            bar = feed.query_one("#trajectories-pagination", PaginationBar)
+            bar = self._pagination_bar
             if bar.has_prev:
                 bar._go_prev()
         except Exception:
@@ -531,31 +541,29 @@ class AgentScreen(SectionNavMixin, Screen):
         """Ordered focusable sections for tab cycling."""
         sections: list = []
         with contextlib.suppress(Exception):
-            sections.append(self.query_one("#trajectory-feed", TrajectoryFeed))
+            sections.append(self._feed)
         with contextlib.suppress(Exception):
-            sections.append(self.query_one("#ask-panel", AskPanel))
+            sections.append(self._ask_panel)
         return sections
 
     def action_ask(self) -> None:
         """Toggle the AI ask panel open/closed."""
         with contextlib.suppress(Exception):
-            panel = self.query_one("#ask-panel", AskPanel)
+            panel = self._ask_panel
             panel.toggle_response()
 
     def on_ask_panel_dismissed(self, _msg: AskPanel.Dismissed) -> None:
         """Restore focus when ask panel closes."""
         with contextlib.suppress(Exception):
-            self.query_one("#trajectory-feed", TrajectoryFeed).focus()
+            self._feed.focus()
 
     def on_screen_resume(self) -> None:
         """Sync AskPanel state when returning to this screen."""
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel)._sync_from_state()
+            self._ask_panel._sync_from_state()
 
     def action_cursor_down(self) -> None:
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-        feed.action_cursor_down()
+        self._feed.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        feed = self.query_one("#trajectory-feed", TrajectoryFeed)
-        feed.action_cursor_up()
+        self._feed.action_cursor_up()
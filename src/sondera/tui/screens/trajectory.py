@@ -5,6 +5,7 @@ import json
 import re
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from pygments.lexer import Lexer
@@ -24,6 +25,7 @@ from textual.containers import Horizontal, ScrollableContainer
 from textual.events import Click
 from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import (
     Footer,
@@ -36,6 +38,7 @@ from sondera.tui.ai.panel import AskInput, AskPanel
 from sondera.tui.colors import ThemeColors, get_theme_colors
 from sondera.tui.events import EventStep, correlate_events
 from sondera.tui.mixins import SectionNavMixin
+from sondera.tui.util import truncate
 from sondera.types import (
     Decision,
     Event,
@@ -130,6 +133,11 @@ def _decision_dim(decision: Decision, c: ThemeColors) -> str:
     return c.dim_allow
 
 
+_STEP_CSS_CLASSES: dict[Decision, str] = {
+    Decision.Deny: "step-deny",
+    Decision.Escalate: "step-escalate",
+}
+
 _ROLE_LABELS: dict[str, str] = (
     {
         "user": "\U0001f464 USER",
@@ -416,7 +424,7 @@ def _get_tool_use_id_from_step(step: EventStep) -> str | None:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class StepGroup:
     """A logical group of related steps."""
 
@@ -481,9 +489,7 @@ def _build_step_groups(steps: list[EventStep]) -> list[StepGroup]:
 
         if content_type == "prompt":
             text = step.text
-            preview = text[:30].replace("\n", " ")
-            if len(text) > 30:
-                preview += "\u2026"
+            preview = truncate(text, 30, 30).replace("\n", " ")
 
             # Absorb consecutive duplicate prompts (same text)
             indices = [i]
@@ -742,10 +748,7 @@ def _enrich_step_groups(groups: list[StepGroup], steps: list[EventStep]) -> None
                     ):
                         val = args.get(key)
                         if val and isinstance(val, str):
-                            val = val.strip().split("\n")[0]
-                            if len(val) > 40:
-                                val = val[:37] + "\u2026"
-                            g.preview = val
+                            g.preview = truncate(val.strip().partition("\n")[0], 40, 37)
                             break
                     if g.preview:
                         break
@@ -766,8 +769,7 @@ def _enrich_step_groups(groups: list[StepGroup], steps: list[EventStep]) -> None
 
         # Use Scanned description as a fallback preview when no other context was found
         if g.tool_id and not g.file_path and not g.preview and g.scan_description:
-            desc = g.scan_description
-            g.preview = desc[:37] + "\u2026" if len(desc) > 40 else desc
+            g.preview = truncate(g.scan_description, 40, 37)
 
         # For response-only groups, extract preview from the response content
         if g.tool_id and not g.file_path and not g.preview and g.is_tool_response:
@@ -782,16 +784,11 @@ def _enrich_step_groups(groups: list[StepGroup], steps: list[EventStep]) -> None
                         break
                     mcp_text = resp.get("text")
                     if isinstance(mcp_text, str) and mcp_text.strip():
-                        line = mcp_text.strip().split("\n")[0]
-                        if len(line) > 40:
-                            line = line[:37] + "\u2026"
-                        g.preview = line
+                        first_line = mcp_text.strip().partition("\n")[0]
+                        g.preview = truncate(first_line, 40, 37)
                         break
                 elif isinstance(resp, str) and resp.strip():
-                    line = resp.strip().split("\n")[0]
-                    if len(line) > 40:
-                        line = line[:37] + "\u2026"
-                    g.preview = line
+                    g.preview = truncate(resp.strip().partition("\n")[0], 40, 37)
                     break
 
         # Repeated call detection (same tool + same file as previous)
@@ -1367,14 +1364,7 @@ def _render_step_content(step: EventStep, step_index: int, c: ThemeColors) -> St
     else:
         rich_text = Text(step.text or str(step.payload))
 
-    if decision == Decision.Deny:
-        css_class = "step-deny"
-    elif decision == Decision.Escalate:
-        css_class = "step-escalate"
-    else:
-        css_class = "step-allow"
-
-    return Static(rich_text, classes=css_class)
+    return Static(rich_text, classes=_STEP_CSS_CLASSES.get(decision, "step-allow"))
 
 
 # ---------------------------------------------------------------------------
@@ -1698,9 +1688,7 @@ def _render_step_row(group: StepGroup, selected: bool, c: ThemeColors) -> Text:
         elif group.decision == Decision.Escalate:
             icon_style = c.warning
         text.append(f"{group.icon} ", style=icon_style)
-        preview = group.prompt_text[:30].replace("\n", " ")
-        if len(group.prompt_text) > 30:
-            preview += "\u2026"
+        preview = truncate(group.prompt_text, 30, 30).replace("\n", " ")
         text.append(f"\u201c{preview}\u201d", style=icon_style)
     else:
         # Decision icon + tool name
@@ -1716,14 +1704,10 @@ def _render_step_row(group: StepGroup, selected: bool, c: ThemeColors) -> Text:
 
         # File name or preview context
         if group.file_path:
-            fn = group.file_path.rsplit("/", 1)[-1]
-            if len(fn) > 18:
-                fn = fn[:15] + "\u2026"
+            fn = truncate(group.file_path.rsplit("/", 1)[-1], 18, 15)
             text.append(f"  {fn}", style=c.fg_dim)
         elif group.preview:
-            preview = group.preview
-            if len(preview) > 24:
-                preview = preview[:21] + "\u2026"
+            preview = truncate(group.preview, 24, 21)
             text.append(f"  {preview}", style=c.fg_dim)
 
         # Scan intent badge (e.g. "investigate", "implement") when available
@@ -1964,7 +1948,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         # Mount new row widgets at the bottom of the step list
         c = get_theme_colors(self.app)
         with contextlib.suppress(Exception):
-            step_list = self.query_one("#step-list", ScrollableContainer)
+            step_list = self._step_list
             for group in added_groups:
                 await step_list.mount(
                     Static(
@@ -1981,7 +1965,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         """Cancel AI stream > dismiss search > pop screen."""
         if self.app._ask_state.stream.is_streaming:  # type: ignore[attr-defined]
             with contextlib.suppress(Exception):
-                self.query_one("#ask-panel", AskPanel).cancel_stream()
+                self._ask_panel.cancel_stream()
             return
         try:
             search = self.query_one("#search-input", Input)
@@ -1996,17 +1980,17 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         """Ordered focusable sections for tab cycling."""
         sections: list = []
         with contextlib.suppress(Exception):
-            sections.append(self.query_one("#step-list", ScrollableContainer))
+            sections.append(self._step_list)
         with contextlib.suppress(Exception):
-            sections.append(self.query_one("#step-detail", ScrollableContainer))
+            sections.append(self._step_detail)
         with contextlib.suppress(Exception):
-            sections.append(self.query_one("#ask-panel", AskPanel))
+            sections.append(self._ask_panel)
         return sections
 
     def action_ask(self) -> None:
         """Toggle the AI ask panel open/closed."""
         try:
-            panel = self.query_one("#ask-panel", AskPanel)
+            panel = self._ask_panel
             panel.toggle_response()
         except Exception:
             pass
@@ -2014,12 +1998,12 @@ class TrajectoryScreen(SectionNavMixin, Screen):
     def on_ask_panel_dismissed(self, _msg: AskPanel.Dismissed) -> None:
         """Restore focus when ask panel closes."""
         with contextlib.suppress(Exception):
-            self.query_one("#step-list", ScrollableContainer).focus()
+            self._step_list.focus()
 
     def on_screen_resume(self) -> None:
         """Sync AskPanel state when returning to this screen."""
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel)._sync_from_state()
+            self._ask_panel._sync_from_state()
 
     def action_noop(self) -> None:
         """Consume Enter so it doesn't bubble to the app."""
@@ -2028,7 +2012,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
     def action_yank(self) -> None:
         """Copy the current step detail panel content to clipboard."""
         try:
-            detail = self.query_one("#step-detail", ScrollableContainer)
+            detail = self._step_detail
             parts: list[str] = []
             for child in detail.children:
                 if isinstance(child, Static):
@@ -2054,6 +2038,8 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         self.trajectory = trajectory
         self.initial_step = initial_step
         self._selected_index: int = 0
+        # Pending detail rebuild while the cursor is moving (see _navigate_to).
+        self._detail_timer: Timer | None = None
 
         # Mutable local copy of trajectory events for live streaming.
         # New events appended via the stream are added here and re-correlated.
@@ -2256,13 +2242,28 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         yield AskPanel(id="ask-panel")
         yield Footer()
 
+    # Widgets composed above live as long as the screen; resolve each once
+    # instead of walking the DOM on every keypress.
+
+    @cached_property
+    def _step_list(self) -> ScrollableContainer:
+        return self.query_one("#step-list", ScrollableContainer)
+
+    @cached_property
+    def _step_detail(self) -> ScrollableContainer:
+        return self.query_one("#step-detail", ScrollableContainer)
+
+    @cached_property
+    def _ask_panel(self) -> AskPanel:
+        return self.query_one("#ask-panel", AskPanel)
+
     # ----- Mount & detail panel -----------------------------------------------
 
     def on_mount(self) -> None:
         summary = self.query_one("#trajectory-summary", Static)
         summary.update(self._render_summary())
 
-        step_list = self.query_one("#step-list", ScrollableContainer)
+        step_list = self._step_list
         step_list.can_focus = True
         step_list.focus()
 
@@ -2286,7 +2287,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         from sondera.tui.ai.panel import AskPanel
 
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel).refresh_suggestion()
+            self._ask_panel.refresh_suggestion()
 
         # Start live event streaming for active (running/pending) trajectories
         status = str(self.trajectory.status or "unknown").lower()
@@ -2303,7 +2304,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
 
     async def _update_detail(self) -> None:
         """Replace the detail panel with the selected step's card."""
-        detail = self.query_one("#step-detail", ScrollableContainer)
+        detail = self._step_detail
         for child in list(detail.children):
             await child.remove()
 
@@ -2343,7 +2344,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         self.call_later(self._update_detail)
         # AskPanel
         with contextlib.suppress(Exception):
-            self.query_one("#ask-panel", AskPanel)._recolor()
+            self._ask_panel._recolor()
 
     def _scroll_to_selected(self) -> None:
         """Scroll the step list to make the selected row visible.
@@ -2354,23 +2355,31 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         try:
             rows = list(self.query(".step-row").results(Static))
             if 0 <= self._selected_index < len(rows):
-                step_list = self.query_one("#step-list", ScrollableContainer)
+                step_list = self._step_list
                 step_list.scroll_to_widget(rows[self._selected_index], animate=False)
         except Exception:
             pass
 
     # ----- Navigation --------------------------------------------------------
 
+    DETAIL_DEBOUNCE = 0.05
+
     def _navigate_to(self, display_index: int) -> None:
         """Navigate to a step: update list selection + detail panel."""
         if display_index < 0 or display_index >= len(self._step_groups):
             return
         old = self._selected_index
+        rows = list(self.query(".step-row").results(Static))
+        if display_index == old:
+            # Already selected: the row and detail card are current, so only
+            # bring the row back into view.
+            if display_index < len(rows):
+                rows[display_index].scroll_visible(animate=False)
+            return
         self._selected_index = display_index
         c = get_theme_colors(self.app)
 
         # Update row styles
-        rows = list(self.query(".step-row").results(Static))
         if 0 <= old < len(rows):
             rows[old].update(_render_step_row(self._step_groups[old], False, c))
             rows[old].remove_class("step-row--selected")
@@ -2384,8 +2393,11 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         # Update minimap
         self._update_minimap(display_index)
 
-        # Update detail panel
-        self.call_later(self._update_detail)
+        # Update detail panel once the cursor settles: holding j/k only
+        # rebuilds the card for the row it stops on.
+        if self._detail_timer is not None:
+            self._detail_timer.stop()
+        self._detail_timer = self.set_timer(self.DETAIL_DEBOUNCE, self._update_detail)
 
     def _current_display_index(self) -> int:
         """Return the current selected display index."""
@@ -2394,7 +2406,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
     def _detail_has_focus(self) -> bool:
         """Check if the detail panel currently has focus."""
         try:
-            detail = self.query_one("#step-detail", ScrollableContainer)
+            detail = self._step_detail
             return self.focused is detail or (
                 self.focused is not None and self.focused.parent is detail
             )
@@ -2403,13 +2415,13 @@ class TrajectoryScreen(SectionNavMixin, Screen):
 
     def action_cursor_down(self) -> None:
         if self._detail_has_focus():
-            self.query_one("#step-detail", ScrollableContainer).scroll_down()
+            self._step_detail.scroll_down()
         else:
             self._navigate_to(self._selected_index + 1)
 
     def action_cursor_up(self) -> None:
         if self._detail_has_focus():
-            self.query_one("#step-detail", ScrollableContainer).scroll_up()
+            self._step_detail.scroll_up()
         else:
             self._navigate_to(self._selected_index - 1)
 
@@ -2420,10 +2432,10 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         self._navigate_to(self._selected_index - 1)
 
     def action_cursor_right(self) -> None:
-        self.query_one("#step-detail", ScrollableContainer).focus()
+        self._step_detail.focus()
 
     def action_cursor_left(self) -> None:
-        self.query_one("#step-list", ScrollableContainer).focus()
+        self._step_list.focus()
 
     def action_vim_left(self) -> None:
         self.action_cursor_left()
@@ -2433,8 +2445,8 @@ class TrajectoryScreen(SectionNavMixin, Screen):
 
     def action_focus_next(self) -> None:
         """Cycle focus between step list and detail panel."""
-        step_list = self.query_one("#step-list", ScrollableContainer)
-        detail = self.query_one("#step-detail", ScrollableContainer)
+        step_list = self._step_list
+        detail = self._step_detail
         if self.focused is step_list or (
             self.focused and self.focused.parent is step_list
         ):
@@ -2485,7 +2497,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
             )
             self._navigate_to(self._search_matches[self._search_match_idx])
             self._update_search_status()
-            self.query_one("#step-list", ScrollableContainer).focus()
+            self._step_list.focus()
             return
 
         # New query: find all matches
@@ -2506,7 +2518,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
 
         self._highlight_matches()
         self._update_search_status()
-        self.query_one("#step-list", ScrollableContainer).focus()
+        self._step_list.focus()
 
     def _dismiss_search(self) -> None:
         """Hide the search bar and clear search state."""
@@ -2519,7 +2531,7 @@ class TrajectoryScreen(SectionNavMixin, Screen):
         self._search_match_idx = 0
         # Remove match highlights
         self._highlight_matches()
-        self.query_one("#step-list", ScrollableContainer).focus()
+        self._step_list.focus()
 
     def _update_search_status(self) -> None:
         """Update the search status bar with match count."""
@@ -2,8 +2,42 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
+from rich.text import Text
+from textual.widget import Widget
+from textual.widgets import Static
+
+import sondera.settings as _settings
+from sondera.harness import SonderaRemoteHarness
+from sondera.types import HarnessClient
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_client(endpoint: str, api_key: str | None) -> HarnessClient:
+    return SonderaRemoteHarness(
+        sondera_harness_endpoint=endpoint, sondera_api_key=api_key
+    ).client
+
+
+def remote_harness() -> SonderaRemoteHarness:
+    """Return a harness for the configured endpoint on a process-wide connection.
+
+    The dashboard and each AI Assist conversation get their own harness (and
+    trajectory state) but share one client, so their calls multiplex over a
+    single connection instead of each paying for a new handshake. Changing
+    the endpoint or token in the config modal yields a fresh client.
+    """
+    endpoint = _settings.SETTINGS.sondera_harness_endpoint
+    api_key = _settings.SETTINGS.sondera_api_token
+    return SonderaRemoteHarness(
+        sondera_harness_endpoint=endpoint,
+        sondera_api_key=api_key,
+        client=_shared_client(endpoint, api_key),
+    )
+
 
 def _utc_seconds_ago(dt: datetime) -> int:
     """Return whole seconds elapsed since *dt*.
@@ -33,3 +67,43 @@ def relative_time(dt: datetime) -> str:
     if seconds < 172800:
         return "yesterday"
     return f"{seconds // 86400}d ago"
+
+
+def truncate(
+    text: str, limit: int, head: int | None = None, ellipsis: str = "\u2026"
+) -> str:
+    """Return *text* unchanged if it fits in *limit*, else cut and add *ellipsis*.
+
+    The cut keeps *head* characters, by default ``limit - len(ellipsis)`` so
+    the result still fits in *limit*.
+    """
+    if len(text) <= limit:
+        return text
+    if head is None:
+        head = limit - len(ellipsis)
+    return text[:head] + ellipsis
+
+
+def sync_rows(
+    container: Widget,
+    widgets: list[Static],
+    rows: Sequence[tuple[Text, str]],
+) -> list[Static]:
+    """Show ``(text, classes)`` *rows* in *container*, reusing mounted *widgets*.
+
+    Widgets already mounted are updated in place; only the difference in row
+    count is mounted or removed, so cursor moves and refreshes do not tear
+    down and remount every row.  Returns the widgets now showing *rows*.
+    """
+    for widget, (text, classes) in zip(widgets, rows, strict=False):
+        widget.update(text)
+        widget.set_classes(classes)
+    if len(rows) > len(widgets):
+        added = [
+            Static(text, classes=classes) for text, classes in rows[len(widgets) :]
+        ]
+        container.mount(*added)
+        return [*widgets, *added]
+    for widget in widgets[len(rows) :]:
+        widget.remove()
+    return widgets[: len(rows)]
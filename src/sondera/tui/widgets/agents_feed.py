@@ -15,12 +15,18 @@ from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Input, Static
 
-from sondera.tui.colors import SPINNER_CHARS, SPINNER_INTERVAL, get_theme_colors
+from sondera.tui.colors import (
+    SPINNER_CHARS,
+    SPINNER_INTERVAL,
+    ThemeColors,
+    get_theme_colors,
+)
 from sondera.tui.util import relative_time as _relative_time
+from sondera.tui.util import sync_rows, truncate
 from sondera.types import Agent
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStatus:
     """Agent with computed dashboard status.
 
@@ -106,7 +112,13 @@ class AgentsFeed(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._selected_index: int = 0
+        # Children created in compose; None until then.
+        self._header: Static | None = None
+        self._container: ScrollableContainer | None = None
         self._spinner_frame: int = 0
+        # Every mounted row; _agent_widgets is the same list minus the
+        # placeholder shown when no agents match.
+        self._mounted_rows: list[Static] = []
         self._agent_widgets: list[Static] = []
         self._timer = None
         self._has_focus: bool = False
@@ -136,13 +148,15 @@ class AgentsFeed(Widget):
             pass
 
     def compose(self) -> ComposeResult:
-        yield Static(id="agents-header")
+        self._header = Static(id="agents-header")
+        yield self._header
         yield Input(
             placeholder="Filter agents... (Esc to close)",
             id="agent-filter",
         )
         container = ScrollableContainer(id="agents-container")
         container.can_focus = False
+        self._container = container
         yield container
 
     def on_mount(self) -> None:
@@ -178,10 +192,8 @@ class AgentsFeed(Widget):
 
     def _rebuild(self) -> None:
         """Rebuild all agent rows."""
-        try:
-            header = self.query_one("#agents-header", Static)
-            container = self.query_one("#agents-container", ScrollableContainer)
-        except Exception:
+        header, container = self._header, self._container
+        if header is None or container is None:
             return
 
         filtered = self._filtered_agents
@@ -202,33 +214,29 @@ class AgentsFeed(Widget):
             header_text.append("[/] filter", style=c.fg_dim)
         header.update(header_text)
 
-        # Rebuild rows
-        container.remove_children()
-        self._agent_widgets = []
-
-        if not filtered:
-            if self._filter_text:
-                empty = Static(
-                    Text(f'  No agents matching "{self._filter_text}"', style=c.fg_dim)
-                )
-            else:
-                empty = Static(Text("  No agents", style=c.fg_dim))
-            empty.add_class("agent-row")
-            container.mount(empty)
-            return
-
+        # Update the mounted rows in place
+        rows: list[tuple[Text, str]] = []
         for i, agent_status in enumerate(filtered):
             is_selected = i == self._selected_index
             text = self._render_agent_row(agent_status, i, is_selected)
-            widget = Static(text)
-            widget.add_class("agent-row")
+            classes = "agent-row"
             if is_selected and self._has_focus:
-                widget.add_class("--selected")
+                classes += " --selected"
             # Highlight problematic agents
             if agent_status.denied_count > 0 or agent_status.awaiting_count > 0:
-                widget.add_class("--problematic")
-            container.mount(widget)
-            self._agent_widgets.append(widget)
+                classes += " --problematic"
+            rows.append((text, classes))
+        if not filtered:
+            if self._filter_text:
+                empty = Text(
+                    f'  No agents matching "{self._filter_text}"', style=c.fg_dim
+                )
+            else:
+                empty = Text("  No agents", style=c.fg_dim)
+            rows.append((empty, "agent-row"))
+
+        self._mounted_rows = sync_rows(container, self._mounted_rows, rows)
+        self._agent_widgets = self._mounted_rows if filtered else []
 
     @staticmethod
     def _total_label(a: AgentStatus) -> str:
@@ -237,9 +245,8 @@ class AgentsFeed(Widget):
         suffix = "+" if a.has_more_trajectories else ""
         return f"{n}{suffix}"
 
-    def _severity_dot(self, a: AgentStatus) -> tuple[str, str]:
+    def _severity_dot(self, a: AgentStatus, c: ThemeColors) -> tuple[str, str]:
         """Return (icon, color) based on agent health severity."""
-        c = get_theme_colors(self.app)
         if a.denied_count > 0:
             return ("\u25cf", c.error)
         if a.awaiting_count > 0:
@@ -264,9 +271,7 @@ class AgentsFeed(Widget):
         text = Text()
         name = a.agent.id
         name_width = 26
-        display_name = (
-            name[: name_width - 1] + "\u2026" if len(name) > name_width else name
-        )
+        display_name = truncate(name, name_width)
         is_live = a.status == "live"
 
         # Cursor indicator (only visible when this feed has focus)
@@ -276,7 +281,7 @@ class AgentsFeed(Widget):
             text.append("  ")
 
         # Severity dot
-        dot_icon, dot_color = self._severity_dot(a)
+        dot_icon, dot_color = self._severity_dot(a, c)
         text.append(f"{dot_icon} ", style=f"bold {dot_color}")
 
         # Agent name
@@ -22,6 +22,8 @@ class DashboardHeader(Widget):
     }
     """
 
+    # Plain repaint reactives: a burst of assignments marks the widget dirty
+    # and Textual paints render() once on the next refresh.
     violation_count = reactive(0)
     awaiting_count = reactive(0)
     live_count = reactive(0)
@@ -74,18 +76,3 @@ class DashboardHeader(Widget):
             text.append(f"{self.total_agents} agents", style=c.fg_dim)
 
         return text
-
-    def watch_violation_count(self) -> None:
-        self.refresh()
-
-    def watch_awaiting_count(self) -> None:
-        self.refresh()
-
-    def watch_live_count(self) -> None:
-        self.refresh()
-
-    def watch_total_agents(self) -> None:
-        self.refresh()
-
-    def watch_problem_agent_count(self) -> None:
-        self.refresh()
@@ -15,9 +15,14 @@ from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Static
 
-from sondera.tui.colors import SPINNER_CHARS, SPINNER_INTERVAL, get_theme_colors
+from sondera.tui.colors import (
+    SPINNER_CHARS,
+    SPINNER_INTERVAL,
+    ThemeColors,
+    get_theme_colors,
+)
 from sondera.tui.events import EventStep, correlate_events, parse_ts
-from sondera.tui.util import _utc_seconds_ago
+from sondera.tui.util import _utc_seconds_ago, sync_rows, truncate
 from sondera.types import Decision, Trajectory
 
 from .pagination_bar import PaginationBar
@@ -273,16 +278,12 @@ def _format_step_snippet(step: EventStep, max_len: int) -> str:
         if args:
             first_key = next(iter(args))
             first_val = str(args[first_key]).strip().replace("\n", " ")
-            if len(first_val) > 25:
-                first_val = first_val[:22] + "..."
+            first_val = truncate(first_val, 25, 22, "...")
             args_str = f'("{first_val}")'
         tool_name = _clean_tool_name(step.tool_id)
         snippet = f"{tool_name}{args_str}"
         return snippet[:max_len]
-    text = step.text.strip().replace("\n", " ")
-    if len(text) > max_len:
-        return text[: max_len - 3] + "..."
-    return text
+    return truncate(step.text.strip().replace("\n", " "), max_len, ellipsis="...")
 
 
 def _activity_snippet(
@@ -328,10 +329,7 @@ def _trajectory_label(
         # Priority 1: first user prompt
         for step in steps:
             if step.content_type == "prompt" and step.text.strip():
-                label = step.text.strip().replace("\n", " ")
-                if len(label) > max_len:
-                    return label[: max_len - 1] + "\u2026"
-                return label
+                return truncate(step.text.strip().replace("\n", " "), max_len)
         # Priority 2: first tool call
         for step in steps:
             if step.content_type == "tool_request":
@@ -339,15 +337,11 @@ def _trajectory_label(
                 args = step.args
                 if args:
                     first_val = str(next(iter(args.values())))
-                    first_val = first_val.strip().replace("\n", " ")
-                    if len(first_val) > 15:
-                        first_val = first_val[:12] + "\u2026"
+                    first_val = truncate(first_val.strip().replace("\n", " "), 15, 12)
                     label = f"{tool_name} {first_val}"
                 else:
                     label = tool_name
-                if len(label) > max_len:
-                    return label[: max_len - 1] + "\u2026"
-                return label
+                return truncate(label, max_len)
         # Has steps but no prompt or tool call
         return tid[:8]
     # Not yet enriched: show short ID so instances are distinguishable
@@ -395,17 +389,29 @@ class TrajectoryFeed(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._selected_index: int = 0
+        # Children created in compose; None until then.
+        self._header: Static | None = None
+        self._container: ScrollableContainer | None = None
+        self._pagination: PaginationBar | None = None
+        # Every mounted row; _row_widgets is the same list minus the
+        # placeholder shown when there are no trajectories.
+        self._mounted_rows: list[Static] = []
         self._row_widgets: list[Static] = []
         self._spinner_frame: int = 0
         self._timer = None
         self._enrichment_attempted: set[str] = (
             set()
         )  # trajectory IDs we tried to enrich
+        # trajectory ID -> (event count, correlated steps); see _event_steps
+        self._steps_cache: dict[str, tuple[int, list[EventStep]]] = {}
 
     def compose(self) -> ComposeResult:
-        yield Static(id="trajectories-header")
-        yield ScrollableContainer(id="trajectories-container")
-        yield PaginationBar(id="trajectories-pagination")
+        self._header = Static(id="trajectories-header")
+        self._container = ScrollableContainer(id="trajectories-container")
+        self._pagination = PaginationBar(id="trajectories-pagination")
+        yield self._header
+        yield self._container
+        yield self._pagination
 
     def on_mount(self) -> None:
         self._timer = self.set_interval(SPINNER_INTERVAL, self._tick)
@@ -426,6 +432,8 @@ class TrajectoryFeed(Widget):
 
     def watch_trajectories(self) -> None:
         self._selected_index = 0
+        names = {t.name for t in self.trajectories}
+        self._steps_cache = {k: v for k, v in self._steps_cache.items() if k in names}
         self._rebuild()
 
     def watch_denied_count(self) -> None:
@@ -439,16 +447,12 @@ class TrajectoryFeed(Widget):
 
     def _update_header(self) -> None:
         """Update the header text with count and stats."""
-        try:
-            header = self.query_one("#trajectories-header", Static)
-        except Exception:
+        header = self._header
+        if header is None:
             return
 
-        try:
-            bar = self.query_one("#trajectories-pagination", PaginationBar)
-            total = bar.total_items
-        except Exception:
-            total = None
+        bar = self._pagination
+        total = bar.total_items if bar is not None else None
         display_count = total if total is not None else len(self.trajectories)
 
         c = get_theme_colors(self.app)
@@ -461,34 +465,26 @@ class TrajectoryFeed(Widget):
 
     def _rebuild(self) -> None:
         """Rebuild all trajectory rows."""
-        try:
-            container = self.query_one("#trajectories-container", ScrollableContainer)
-        except Exception:
+        container = self._container
+        if container is None:
             return
 
         self._update_header()
         trajectories = self.trajectories
 
-        # Rebuild rows
-        container.remove_children()
-        self._row_widgets = []
-
-        if not trajectories:
-            c = get_theme_colors(self.app)
-            empty = Static(Text("  No trajectories", style=c.fg_dim))
-            empty.add_class("trajectory-row")
-            container.mount(empty)
-            return
-
+        # Update the mounted rows in place
+        rows: list[tuple[Text, str]] = []
         for i, trajectory in enumerate(trajectories):
             is_selected = i == self._selected_index
             row = self._render_row(trajectory, is_selected, self._spinner_frame)
-            widget = Static(row)
-            widget.add_class("trajectory-row")
-            if is_selected:
-                widget.add_class("--selected")
-            container.mount(widget)
-            self._row_widgets.append(widget)
+            classes = "trajectory-row --selected" if is_selected else "trajectory-row"
+            rows.append((row, classes))
+        if not trajectories:
+            c = get_theme_colors(self.app)
+            rows.append((Text("  No trajectories", style=c.fg_dim), "trajectory-row"))
+
+        self._mounted_rows = sync_rows(container, self._mounted_rows, rows)
+        self._row_widgets = self._mounted_rows if trajectories else []
 
         # Scroll to keep the selected row visible
         if self._row_widgets and 0 <= self._selected_index < len(self._row_widgets):
@@ -506,9 +502,8 @@ class TrajectoryFeed(Widget):
             return 30
         return 18
 
-    def _status_icon_color(self, status: str) -> tuple[str, str]:
+    def _status_icon_color(self, status: str, c: ThemeColors) -> tuple[str, str]:
         """Return (icon, color) for a trajectory status using theme colors."""
-        c = get_theme_colors(self.app)
         color_map = {
             "running": c.primary,
             "pending": c.primary,
@@ -521,9 +516,8 @@ class TrajectoryFeed(Widget):
         color = color_map.get(status, c.fg_secondary)
         return icon, color
 
-    def _status_text_color(self, status: str) -> str:
+    def _status_text_color(self, status: str, c: ThemeColors) -> str:
         """Return text color for a trajectory status label."""
-        c = get_theme_colors(self.app)
         color_map = {
             "running": c.primary,
             "pending": c.primary,
@@ -534,6 +528,20 @@ class TrajectoryFeed(Widget):
         }
         return color_map.get(status, c.fg_secondary)
 
+    def _event_steps(self, trajectory: Trajectory) -> list[EventStep]:
+        """Correlated steps for *trajectory*, reused until its events change.
+
+        Rows re-render on every cursor move and spinner tick; events only
+        ever grow, so the event count is enough to tell when to recorrelate.
+        """
+        events = trajectory.events or []
+        cached = self._steps_cache.get(trajectory.name)
+        if cached is not None and cached[0] == len(events):
+            return cached[1]
+        steps = correlate_events(events) if events else []
+        self._steps_cache[trajectory.name] = (len(events), steps)
+        return steps
+
     def _render_row(
         self,
         trajectory: Trajectory,
@@ -547,7 +555,7 @@ class TrajectoryFeed(Widget):
         label_w = self._label_width()
 
         # Compute correlated steps once for the entire row
-        event_steps = _get_event_steps(trajectory)
+        event_steps = self._event_steps(trajectory)
 
         # Cursor
         if is_selected:
@@ -566,7 +574,7 @@ class TrajectoryFeed(Widget):
         elif stale:
             text.append("\u2713 ", style=f"bold {c.fg_dim}")
         else:
-            icon, icon_color = self._status_icon_color(status)
+            icon, icon_color = self._status_icon_color(status, c)
             text.append(icon, style=f"bold {icon_color}")
 
         # Trajectory label (first user prompt or short ID)
@@ -580,7 +588,7 @@ class TrajectoryFeed(Widget):
         if stale:
             text.append("timed out".ljust(12), style=c.fg_dim)
         else:
-            status_color = self._status_text_color(status)
+            status_color = self._status_text_color(status, c)
             status_label = _STATUS_LABELS.get(status, status)
             text.append(status_label.ljust(12), style=status_color)
 
@@ -675,11 +683,8 @@ class TrajectoryFeed(Widget):
 
     def update_pagination(self, next_token: str, page_count: int = 0) -> None:
         """Update the pagination bar state."""
-        try:
-            bar = self.query_one("#trajectories-pagination", PaginationBar)
-            bar.update_state(next_token, page_count=page_count)
-        except Exception:
-            pass
+        if self._pagination is not None:
+            self._pagination.update_state(next_token, page_count=page_count)
 
     def get_selected_trajectory(self) -> Trajectory | None:
         """Get the currently selected trajectory."""
@@ -19,12 +19,13 @@ from textual.widgets import Static
 from sondera.tui.colors import get_theme_colors
 from sondera.tui.events import ViolationRecord
 from sondera.tui.util import relative_time as _relative_time
+from sondera.tui.util import sync_rows
 from sondera.types import Decision
 
 MAX_VISIBLE_GROUPS = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class ViolationGroup:
     """Violations grouped by agent + decision + reason."""
 
@@ -92,6 +93,13 @@ class ViolationsFeed(Widget):
             self.record = record
             super().__init__()
 
+    class ViolationHighlighted(Message):
+        """Posted when the cursor moves onto a violation."""
+
+        def __init__(self, record: ViolationRecord) -> None:
+            self.record = record
+            super().__init__()
+
     class AgentJumpRequested(Message):
         """Posted when user presses 'a' to jump to the agent."""
 
@@ -102,6 +110,12 @@ class ViolationsFeed(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._selected_index: int = 0
+        # Children created in compose; None until then.
+        self._header: Static | None = None
+        self._container: ScrollableContainer | None = None
+        # Every mounted row (labels, groups, details); _row_widgets holds
+        # just the group rows, in navigation order.
+        self._mounted_rows: list[Static] = []
         self._row_widgets: list[Static] = []
         self._has_focus: bool = False
         # Built groups (for navigation)
@@ -124,9 +138,11 @@ class ViolationsFeed(Widget):
             pass
 
     def compose(self) -> ComposeResult:
-        yield Static(id="violations-header")
+        self._header = Static(id="violations-header")
+        yield self._header
         container = ScrollableContainer(id="violations-container")
         container.can_focus = False
+        self._container = container
         yield container
 
     @property
@@ -141,12 +157,10 @@ class ViolationsFeed(Widget):
     ) -> None:
         # Preserve selection by matching group identity across refreshes
         old_groups = self._flat_groups
+        self._regroup()
         if old_groups and 0 <= self._selected_index < len(old_groups):
             prev = old_groups[self._selected_index]
             prev_key = (prev.agent_id, prev.decision, prev.reason)
-            # Rebuild groups first so we can search the new list
-            self._deny_groups, self._escalate_groups = self._build_groups()
-            self._flat_groups = self._deny_groups + self._escalate_groups
             for i, g in enumerate(self._flat_groups):
                 if (g.agent_id, g.decision, g.reason) == prev_key:
                     self._selected_index = i
@@ -158,15 +172,29 @@ class ViolationsFeed(Widget):
         self._rebuild()
 
     def watch_agents_map(self) -> None:
+        self._regroup()
         self._rebuild()
 
     def watch_trajectory_times(self) -> None:
         self._rebuild()
 
+    def _regroup(self) -> None:
+        """Regroup violations; only needed when the records or names change.
+
+        Cursor moves, focus changes and time updates re-render from the
+        cached groups instead of regrouping every record.
+        """
+        self._deny_groups, self._escalate_groups = self._build_groups()
+        # Flat list for cursor navigation: DENY groups then ESCALATE groups
+        self._flat_groups = self._deny_groups + self._escalate_groups
+
     def _build_groups(
         self,
     ) -> tuple[list[ViolationGroup], list[ViolationGroup]]:
         """Group violations by (agent_id, decision, reason) into DENY and ESCALATE lists."""
+        # Reactive attributes resolve through a descriptor on every access,
+        # so look the agents map up once rather than once per group.
+        agent_name_for = self.agents_map.get
         groups_map: dict[tuple, list[ViolationRecord]] = defaultdict(list)
         for record in self.violations:
             key = (
@@ -181,7 +209,7 @@ class ViolationsFeed(Widget):
 
         for (agent_id, _decision_val, reason), records in groups_map.items():
             decision = records[0].decision
-            agent_name = self.agents_map.get(agent_id) or agent_id[:16]
+            agent_name = agent_name_for(agent_id) or agent_id[:16]
             policy_id = ""
             policy_desc = ""
             if records[0].policies:
@@ -210,18 +238,11 @@ class ViolationsFeed(Widget):
 
     def _rebuild(self) -> None:
         """Rebuild all violation rows with DENY/ESCALATE sections."""
-        try:
-            header = self.query_one("#violations-header", Static)
-            container = self.query_one("#violations-container", ScrollableContainer)
-        except Exception:
+        header, container = self._header, self._container
+        if header is None or container is None:
             return
 
         total_count = len(self.violations)
-        self._deny_groups, self._escalate_groups = self._build_groups()
-
-        # Flat list for cursor navigation: DENY groups then ESCALATE groups
-        self._flat_groups = self._deny_groups + self._escalate_groups
-
         c = get_theme_colors(self.app)
 
         # Update header
@@ -230,14 +251,15 @@ class ViolationsFeed(Widget):
         header_text.append(f" ({total_count})", style=c.fg_dim)
         header.update(header_text)
 
-        # Rebuild rows
-        container.remove_children()
-        self._row_widgets = []
+        # Lay out rows, then update the mounted widgets in place
+        rows: list[tuple[Text, str]] = []
+        group_positions: list[int] = []
 
         if not self._flat_groups:
-            empty = Static(Text("  \u2713 No policy violations", style=c.success))
-            empty.add_class("violation-row")
-            container.mount(empty)
+            empty = Text("  \u2713 No policy violations", style=c.success)
+            rows.append((empty, "violation-row"))
+            self._mounted_rows = sync_rows(container, self._mounted_rows, rows)
+            self._row_widgets = []
             return
 
         flat_idx = 0
@@ -249,13 +271,12 @@ class ViolationsFeed(Widget):
                 deny_count = sum(g.count for g in self._deny_groups)
                 section = Text()
                 section.append(f"  DENIED ({deny_count})", style=f"bold {c.error}")
-                section_widget = Static(section)
-                section_widget.add_class("section-label")
-                container.mount(section_widget)
+                rows.append((section, "section-label"))
 
             for group in self._deny_groups:
                 is_selected = flat_idx == self._selected_index
-                self._mount_group_row(container, group, is_selected, flat_idx)
+                group_positions.append(len(rows))
+                self._add_group_rows(rows, group, is_selected)
                 flat_idx += 1
 
         # AWAITING REVIEW section (only shown when escalations exist)
@@ -267,38 +288,32 @@ class ViolationsFeed(Widget):
                     f"  AWAITING REVIEW ({escalate_count})",
                     style=f"bold {c.warning}",
                 )
-                section_widget = Static(section)
-                section_widget.add_class("section-label")
-                container.mount(section_widget)
+                rows.append((section, "section-label"))
 
             for group in self._escalate_groups:
                 is_selected = flat_idx == self._selected_index
-                self._mount_group_row(container, group, is_selected, flat_idx)
+                group_positions.append(len(rows))
+                self._add_group_rows(rows, group, is_selected)
                 flat_idx += 1
 
-    def _mount_group_row(
+        self._mounted_rows = sync_rows(container, self._mounted_rows, rows)
+        self._row_widgets = [self._mounted_rows[i] for i in group_positions]
+
+    def _add_group_rows(
         self,
-        container: ScrollableContainer,
+        rows: list[tuple[Text, str]],
         group: ViolationGroup,
         is_selected: bool,
-        flat_idx: int,
     ) -> None:
-        """Mount a violation group row and optional inline detail."""
+        """Append a violation group row and optional inline detail to *rows*."""
         row_text = self._render_group_row(group, is_selected)
-        widget = Static(row_text)
-        widget.add_class("violation-row")
-        if is_selected and self._has_focus:
-            widget.add_class("--selected")
-        container.mount(widget)
-        self._row_widgets.append(widget)
-
-        # Inline detail for selected row (only when focused)
         if is_selected and self._has_focus:
-            details = self._render_group_detail(group)
-            for detail_text in details:
-                d = Static(detail_text)
-                d.add_class("violation-detail")
-                container.mount(d)
+            rows.append((row_text, "violation-row --selected"))
+            # Inline detail for selected row (only when focused)
+            for detail_text in self._render_group_detail(group):
+                rows.append((detail_text, "violation-detail"))
+        else:
+            rows.append((row_text, "violation-row"))
 
     def _render_group_row(self, group: ViolationGroup, is_selected: bool) -> Text:
         """Render a single violation group row."""
@@ -345,12 +360,13 @@ class ViolationsFeed(Widget):
 
     def _best_time_for_group(self, group: ViolationGroup) -> datetime | None:
         """Get the most recent trajectory time for a group."""
-        if not self.trajectory_times:
+        trajectory_times = self.trajectory_times
+        if not trajectory_times:
             return None
         times = [
-            self.trajectory_times[tid]
+            t
             for tid in group.trajectory_ids
-            if tid in self.trajectory_times
+            if (t := trajectory_times.get(tid)) is not None
         ]
         return max(times) if times else None
 
@@ -398,6 +414,7 @@ class ViolationsFeed(Widget):
                     # Select this row
                     self._selected_index = i
                     self._rebuild()
+                    self._post_highlighted()
                 self.focus()
                 event.stop()
                 return
@@ -408,12 +425,21 @@ class ViolationsFeed(Widget):
         if visible and self._selected_index < len(visible) - 1:
             self._selected_index += 1
             self._rebuild()
+            self._post_highlighted()
 
     def action_cursor_up(self) -> None:
         """Move cursor up."""
         if self._selected_index > 0:
             self._selected_index -= 1
             self._rebuild()
+            self._post_highlighted()
+
+    def _post_highlighted(self) -> None:
+        visible = self._visible_violations
+        if 0 <= self._selected_index < len(visible):
+            self.post_message(
+                self.ViolationHighlighted(visible[self._selected_index].records[0])
+            )
 
     def action_select(self) -> None:
         """Select the current violation (open adjudication detail)."""
@@ -5,6 +5,7 @@ Install with: uv pip install -e ".[adk]"
 """
 
 import json
+from collections.abc import Callable
 from typing import Any
 
 import pytest
@@ -18,141 +19,97 @@ from sondera import Agent, Tool
 from sondera.adk.analyze import format
 
 
-def _tools(agent: Agent) -> list[Tool]:
-    """Get tools from agent card."""
-    return agent.card.react_card.tools if agent.card and agent.card.react_card else []
-
-
-def test_format_agent_with_base_tool_json_schemas():
-    """Test that BaseTool instances include parameters_json_schema and response_json_schema."""
-
-    def search_tool(query: str, limit: int = 10) -> dict[str, Any]:
-        """Search for information.
-
-        Args:
-            query: Search query string
-            limit: Maximum number of results to return
-        """
-        return {
-            "query": query,
-            "results": ["result1", "result2"],
-            "count": 2,
-        }
-
-    # Create real ADK agent
-    adk_agent = AdkAgent(
-        model="gemini-2.5-flash",
-        name="test_agent",
-        description="Test agent description",
-        instruction="Test instruction",
-        tools=[search_tool],
-    )
-
-    # Format the agent
-    result = format(adk_agent, agent_name="Test Agent", agent_id="test-agent-1")
-
-    # Verify the result
-    assert isinstance(result, Agent)
-    assert result.id == "test-agent-1"
-    assert result.provider == "google-adk"
-    tools = _tools(result)
-    assert len(tools) == 1
+def search_tool(query: str, limit: int = 10) -> dict[str, Any]:
+    """Search for information.
 
-    # Verify the tool has JSON schemas
-    tool = tools[0]
-    assert isinstance(tool, Tool)
-    assert tool.name == "search_tool"
-    assert "Search for information" in tool.description
-    assert tool.parameters_json_schema is not None
+    Args:
+        query: Search query string
+        limit: Maximum number of results to return
+    """
+    return {
+        "query": query,
+        "results": ["result1", "result2"],
+        "count": 2,
+    }
 
-    # Verify parameters JSON schema content
-    params_schema_dict = json.loads(tool.parameters_json_schema)
-    assert params_schema_dict["type"] == "OBJECT"
-    assert "query" in params_schema_dict["properties"]
-    assert "limit" in params_schema_dict["properties"]
 
+def simple_tool(input: str) -> str:
+    """Simple tool that processes input.
 
-def test_format_agent_with_base_tool_no_response_schema():
-    """Test that BaseTool instances work when response schema is not provided."""
+    Args:
+        input: Input string to process
+    """
+    return f"Processed: {input}"
 
-    def simple_tool(input: str) -> str:
-        """Simple tool that processes input.
 
-        Args:
-            input: Input string to process
-        """
-        return f"Processed: {input}"
+def tool1(x: str) -> str:
+    """First tool.
 
-    # Create real ADK agent
-    adk_agent = AdkAgent(
-        model="gemini-2.5-flash",
-        name="test_agent",
-        description="Test agent description",
-        instruction="Test instruction",
-        tools=[simple_tool],
-    )
+    Args:
+        x: String parameter
+    """
+    return f"Result: {x}"
 
-    # Format the agent
-    result = format(adk_agent, agent_name="Test Agent", agent_id="test-agent-2")
 
-    # Verify the result
-    tool = _tools(result)[0]
-    assert tool.parameters_json_schema is not None
-    # Response schema may or may not be present depending on ADK version
-    # The important thing is that parameters_json_schema is present
+def tool2(y: int) -> int:
+    """Second tool.
 
-    # Verify parameters JSON schema is valid
-    params_schema_dict = json.loads(tool.parameters_json_schema)
-    assert params_schema_dict["type"] == "OBJECT"
-    assert "input" in params_schema_dict["properties"]
+    Args:
+        y: Integer parameter
+    """
+    return y * 2
 
 
-def test_format_agent_with_multiple_base_tools():
-    """Test formatting agent with multiple BaseTool instances."""
+TOOLS: dict[str, Callable[..., Any]] = {
+    "search_tool": search_tool,
+    "simple_tool": simple_tool,
+    "tool1": tool1,
+    "tool2": tool2,
+}
 
-    def tool1(x: str) -> str:
-        """First tool.
+# Each case lists the tools given to the agent and, per tool, the parameter
+# names its JSON schema must expose.
+CASES = [
+    {"search_tool": {"query", "limit"}},
+    {"simple_tool": {"input"}},
+    {"tool1": {"x"}, "tool2": {"y"}},
+]
 
-        Args:
-            x: String parameter
-        """
-        return f"Result: {x}"
 
-    def tool2(y: int) -> int:
-        """Second tool.
+def _tools(agent: Agent) -> list[Tool]:
+    """Get tools from agent card."""
+    return agent.card.react_card.tools if agent.card and agent.card.react_card else []
 
-        Args:
-            y: Integer parameter
-        """
-        return y * 2
 
+@pytest.mark.parametrize("expected_props", CASES, ids=lambda c: "-".join(c))
+def test_format_agent_with_base_tool_json_schemas(
+    expected_props: dict[str, set[str]],
+):
+    """Test that BaseTool instances include a parameters_json_schema."""
     # Create real ADK agent
     adk_agent = AdkAgent(
         model="gemini-2.5-flash",
         name="test_agent",
         description="Test agent description",
         instruction="Test instruction",
-        tools=[tool1, tool2],
+        tools=[TOOLS[name] for name in expected_props],
     )
 
-    # Format the agent
-    result = format(
-        adk_agent, agent_name="Multi Tool Agent", agent_id="multi-tool-agent"
-    )
+    result = format(adk_agent, agent_name="Test Agent", agent_id="test-agent-1")
 
-    # Verify both tools have JSON schemas
+    assert isinstance(result, Agent)
+    assert result.id == "test-agent-1"
+    assert result.provider == "google-adk"
     tools = _tools(result)
-    assert len(tools) == 2
-    assert tools[0].parameters_json_schema is not None
-    assert tools[1].parameters_json_schema is not None
-
-    # Verify tool names
-    assert tools[0].name == "tool1"
-    assert tools[1].name == "tool2"
-
-    # Verify parameters JSON schemas
-    params1_schema = json.loads(tools[0].parameters_json_schema)
-    assert "x" in params1_schema["properties"]
-
-    params2_schema = json.loads(tools[1].parameters_json_schema)
-    assert "y" in params2_schema["properties"]
+    assert [t.name for t in tools] == list(expected_props)
+
+    # Response schema may or may not be present depending on ADK version;
+    # the parameters schema is what must always be there.
+    for tool in tools:
+        assert isinstance(tool, Tool)
+        summary = TOOLS[tool.name].__doc__.partition("\n")[0]
+        assert summary in tool.description
+        assert tool.parameters_json_schema is not None
+        params_schema_dict = json.loads(tool.parameters_json_schema)
+        assert params_schema_dict["type"] == "OBJECT"
+        assert expected_props[tool.name] <= params_schema_dict["properties"].keys()
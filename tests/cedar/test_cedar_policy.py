@@ -3,6 +3,7 @@
 import json
 
 import pytest
+from cedar.schema import CedarSchema
 
 from sondera import (
     Agent,
@@ -21,7 +22,7 @@ from sondera.harness.cedar.harness import CedarPolicyHarness
 from sondera.harness.cedar.schema import agent_to_cedar_schema
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def coding_agent() -> Agent:
     """Create a simple coding agent with several tools."""
     return Agent(
@@ -101,6 +102,12 @@ def coding_agent() -> Agent:
     )
 
 
+@pytest.fixture(scope="module")
+def coding_agent_schema(coding_agent: Agent) -> CedarSchema:
+    """Build the coding agent's Cedar schema once for the module."""
+    return agent_to_cedar_schema(coding_agent)
+
+
 def _tool_call_event(harness, tool_name: str, arguments: dict) -> Event:
     """Helper to build a ToolCall event."""
     return Event(
@@ -140,26 +147,23 @@ class TestCedarPolicyHarnessInit:
                 schema=None,
             )
 
-    def test_requires_policy_set(self, coding_agent):
+    def test_requires_policy_set(self, coding_agent_schema):
         """Test that policy_set is required."""
-        schema = agent_to_cedar_schema(coding_agent)
         with pytest.raises(ValueError, match="policy_set is required"):
-            CedarPolicyHarness(policy_set=None, schema=schema)
+            CedarPolicyHarness(policy_set=None, schema=coding_agent_schema)
 
-    def test_requires_id_annotation(self, coding_agent):
+    def test_requires_id_annotation(self, coding_agent_schema):
         """Test that @id annotation is required on all policies."""
-        schema = agent_to_cedar_schema(coding_agent)
         with pytest.raises(ValueError, match="missing required @id annotation"):
             CedarPolicyHarness(
                 policy_set="permit(principal, action, resource);",
-                schema=schema,
+                schema=coding_agent_schema,
             )
 
-    def test_warns_on_duplicate_id(self, coding_agent, caplog):
+    def test_warns_on_duplicate_id(self, coding_agent_schema, caplog):
         """Test that duplicate @id annotations trigger a warning."""
         import logging
 
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("duplicate-id")
         permit(principal, action, resource);
@@ -168,25 +172,23 @@ class TestCedarPolicyHarnessInit:
         forbid(principal, action == CodingAgent::Action::"read_file", resource);
         """
         with caplog.at_level(logging.WARNING):
-            CedarPolicyHarness(policy_set=policy, schema=schema)
+            CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
 
         assert "Duplicate policy @id: 'duplicate-id'" in caplog.text
 
-    def test_accepts_policy_string(self, coding_agent):
+    def test_accepts_policy_string(self, coding_agent_schema):
         """Test that policy can be provided as a string."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
         assert harness._namespace == "CodingAgent"
 
-    def test_extracts_namespace_from_schema(self, coding_agent):
+    def test_extracts_namespace_from_schema(self, coding_agent_schema):
         """Test that namespace is correctly extracted from schema."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
         assert harness._namespace == "CodingAgent"
 
@@ -195,12 +197,11 @@ class TestCedarPolicyHarnessLifecycle:
     """Tests for harness lifecycle methods."""
 
     @pytest.mark.asyncio
-    async def test_initialize_sets_agent(self, coding_agent):
+    async def test_initialize_sets_agent(self, coding_agent, coding_agent_schema):
         """Test that initialize sets the agent."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         await harness.initialize(agent=coding_agent)
@@ -210,12 +211,11 @@ class TestCedarPolicyHarnessLifecycle:
         assert harness._authorizer is not None
 
     @pytest.mark.asyncio
-    async def test_resume_restores_trajectory(self, coding_agent):
+    async def test_resume_restores_trajectory(self, coding_agent, coding_agent_schema):
         """Test that resume restores an existing trajectory from storage."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         # Initialize and adjudicate to create a trajectory with steps
@@ -233,24 +233,24 @@ class TestCedarPolicyHarnessLifecycle:
         assert harness._trajectory_step_count == 1
 
     @pytest.mark.asyncio
-    async def test_resume_unknown_trajectory_raises(self, coding_agent):
+    async def test_resume_unknown_trajectory_raises(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that resume raises ValueError for unknown trajectory."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         with pytest.raises(ValueError, match="not found in storage"):
             await harness.resume("nonexistent-id", agent=coding_agent)
 
     @pytest.mark.asyncio
-    async def test_finalize_clears_trajectory(self, coding_agent):
+    async def test_finalize_clears_trajectory(self, coding_agent, coding_agent_schema):
         """Test that finalize clears the trajectory."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         await harness.initialize(agent=coding_agent)
@@ -259,19 +259,20 @@ class TestCedarPolicyHarnessLifecycle:
         assert harness._trajectory_id is None
 
     @pytest.mark.asyncio
-    async def test_finalize_raises_without_trajectory(self, coding_agent):
+    async def test_finalize_raises_without_trajectory(self, coding_agent_schema):
         """Test that finalize raises when no trajectory is active."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         with pytest.raises(ValueError, match="No active trajectory"):
             await harness.finalize()
 
     @pytest.mark.asyncio
-    async def test_fail_marks_trajectory_failed_and_clears(self, coding_agent):
+    async def test_fail_marks_trajectory_failed_and_clears(
+        self, coding_agent, coding_agent_schema
+    ):
         """fail() should write a Failed status and clear the active trajectory."""
         from unittest.mock import MagicMock
 
@@ -279,10 +280,9 @@ class TestCedarPolicyHarnessLifecycle:
         from sondera.types import TrajectoryStatus
 
         mock_storage = MagicMock(spec=TrajectoryStorage)
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
             storage=mock_storage,
         )
 
@@ -301,19 +301,20 @@ class TestCedarPolicyHarnessLifecycle:
         )
 
     @pytest.mark.asyncio
-    async def test_fail_raises_without_active_trajectory(self, coding_agent):
+    async def test_fail_raises_without_active_trajectory(self, coding_agent_schema):
         """fail() without an active trajectory should raise ValueError."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         with pytest.raises(ValueError, match="No active trajectory"):
             await harness.fail(reason="crash")
 
     @pytest.mark.asyncio
-    async def test_fail_clears_trajectory_even_if_storage_raises(self, coding_agent):
+    async def test_fail_clears_trajectory_even_if_storage_raises(
+        self, coding_agent, coding_agent_schema
+    ):
         """trajectory_id must be cleared even when storage.finalize_trajectory raises."""
         from unittest.mock import MagicMock
 
@@ -321,10 +322,9 @@ class TestCedarPolicyHarnessLifecycle:
 
         mock_storage = MagicMock(spec=TrajectoryStorage)
         mock_storage.finalize_trajectory.side_effect = OSError("disk full")
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
             storage=mock_storage,
         )
 
@@ -341,20 +341,25 @@ class TestCedarPolicyHarnessLifecycle:
 class TestCedarPolicyHarnessPermitAll:
     """Tests for permit-all policy."""
 
-    @pytest.fixture
-    def permit_all_harness(self, coding_agent):
-        """Create a harness with permit-all policy."""
-        schema = agent_to_cedar_schema(coding_agent)
+    @pytest.fixture(scope="class")
+    def permit_all_harness(self, coding_agent_schema):
+        """Create a harness with permit-all policy, shared by the class."""
         return CedarPolicyHarness(
             policy_set='@id("allow-all") permit(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
-    @pytest.mark.asyncio
-    async def test_allows_read_file(self, permit_all_harness, coding_agent):
-        """Test that read_file is allowed."""
+    @pytest.fixture(autouse=True)
+    async def _fresh_trajectory(self, permit_all_harness, coding_agent):
+        """Run each test on a new trajectory without rebuilding the harness."""
         await permit_all_harness.initialize(agent=coding_agent)
+        yield
+        if permit_all_harness.trajectory_id is not None:
+            await permit_all_harness.finalize()
 
+    @pytest.mark.asyncio
+    async def test_allows_read_file(self, permit_all_harness):
+        """Test that read_file is allowed."""
         result = await permit_all_harness.adjudicate(
             _tool_call_event(permit_all_harness, "read_file", {"path": "/etc/passwd"})
         )
@@ -362,10 +367,8 @@ class TestCedarPolicyHarnessPermitAll:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_allows_write_file(self, permit_all_harness, coding_agent):
+    async def test_allows_write_file(self, permit_all_harness):
         """Test that write_file is allowed."""
-        await permit_all_harness.initialize(agent=coding_agent)
-
         result = await permit_all_harness.adjudicate(
             _tool_call_event(
                 permit_all_harness,
@@ -377,10 +380,8 @@ class TestCedarPolicyHarnessPermitAll:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_allows_execute_command(self, permit_all_harness, coding_agent):
+    async def test_allows_execute_command(self, permit_all_harness):
         """Test that execute_command is allowed."""
-        await permit_all_harness.initialize(agent=coding_agent)
-
         result = await permit_all_harness.adjudicate(
             _tool_call_event(
                 permit_all_harness,
@@ -392,10 +393,8 @@ class TestCedarPolicyHarnessPermitAll:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_allows_tool_response(self, permit_all_harness, coding_agent):
+    async def test_allows_tool_response(self, permit_all_harness):
         """Test that tool responses are allowed."""
-        await permit_all_harness.initialize(agent=coding_agent)
-
         result = await permit_all_harness.adjudicate(
             _tool_output_event(
                 permit_all_harness,
@@ -410,20 +409,25 @@ class TestCedarPolicyHarnessPermitAll:
 class TestCedarPolicyHarnessDenyAll:
     """Tests for deny-all policy."""
 
-    @pytest.fixture
-    def deny_all_harness(self, coding_agent):
-        """Create a harness with deny-all policy."""
-        schema = agent_to_cedar_schema(coding_agent)
+    @pytest.fixture(scope="class")
+    def deny_all_harness(self, coding_agent_schema):
+        """Create a harness with deny-all policy, shared by the class."""
         return CedarPolicyHarness(
             policy_set='@id("deny-all") forbid(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
-    @pytest.mark.asyncio
-    async def test_denies_all_tools(self, deny_all_harness, coding_agent):
-        """Test that all tools are denied."""
+    @pytest.fixture(autouse=True)
+    async def _fresh_trajectory(self, deny_all_harness, coding_agent):
+        """Run each test on a new trajectory without rebuilding the harness."""
         await deny_all_harness.initialize(agent=coding_agent)
+        yield
+        if deny_all_harness.trajectory_id is not None:
+            await deny_all_harness.finalize()
 
+    @pytest.mark.asyncio
+    async def test_denies_all_tools(self, deny_all_harness):
+        """Test that all tools are denied."""
         # Test each tool with appropriate args for its schema
         test_cases = [
             ("read_file", {"path": "/test"}),
@@ -443,9 +447,8 @@ class TestCedarPolicyHarnessTypedParameters:
     """Tests for policies using typed parameters."""
 
     @pytest.mark.asyncio
-    async def test_deny_specific_path(self, coding_agent):
+    async def test_deny_specific_path(self, coding_agent, coding_agent_schema):
         """Test policy that denies specific file paths."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -454,7 +457,7 @@ class TestCedarPolicyHarnessTypedParameters:
         forbid(principal, action == CodingAgent::Action::"read_file", resource)
         when { context.parameters.path == "/etc/passwd" };
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         # Reading /etc/passwd should be denied
@@ -470,9 +473,8 @@ class TestCedarPolicyHarnessTypedParameters:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_deny_dangerous_commands(self, coding_agent):
+    async def test_deny_dangerous_commands(self, coding_agent, coding_agent_schema):
         """Test policy that denies dangerous commands using pattern matching."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -485,7 +487,7 @@ class TestCedarPolicyHarnessTypedParameters:
         forbid(principal, action == CodingAgent::Action::"execute_command", resource)
         when { context.parameters_json like "*sudo*" };
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         # rm -rf should be denied
@@ -519,9 +521,10 @@ class TestCedarPolicyHarnessTypedParameters:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_allow_only_specific_directory(self, coding_agent):
+    async def test_allow_only_specific_directory(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test policy that only allows operations in specific directory."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-read-workspace")
         permit(principal, action == CodingAgent::Action::"read_file", resource)
@@ -537,7 +540,7 @@ class TestCedarPolicyHarnessTypedParameters:
         @id("allow-execute-command")
         permit(principal, action == CodingAgent::Action::"execute_command", resource);
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         # Reading from /workspace should be allowed
@@ -557,9 +560,8 @@ class TestCedarPolicyHarnessResponseFiltering:
     """Tests for policies that filter tool responses."""
 
     @pytest.mark.asyncio
-    async def test_deny_response_with_secrets(self, coding_agent):
+    async def test_deny_response_with_secrets(self, coding_agent, coding_agent_schema):
         """Test policy that denies responses containing secrets."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -576,7 +578,7 @@ class TestCedarPolicyHarnessResponseFiltering:
         forbid(principal, action, resource)
         when { context.response_json like "*secret*" };
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         # Response with password should be denied
@@ -614,11 +616,12 @@ class TestCedarPolicyHarnessNonToolContent:
     """Tests for prompt content handling."""
 
     @pytest.mark.asyncio
-    async def test_allows_prompt_content_with_permit_policy(self, coding_agent):
+    async def test_allows_prompt_content_with_permit_policy(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that prompt content is evaluated against policies."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = '@id("allow-all") permit(principal, action, resource);'
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         result = await harness.adjudicate(
@@ -628,11 +631,12 @@ class TestCedarPolicyHarnessNonToolContent:
         assert result.decision == Decision.Allow
 
     @pytest.mark.asyncio
-    async def test_denies_prompt_content_with_forbid_policy(self, coding_agent):
+    async def test_denies_prompt_content_with_forbid_policy(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that prompt content can be denied by policy."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = '@id("deny-prompt") forbid(principal, action == CodingAgent::Action::"Prompt", resource);'
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         result = await harness.adjudicate(
@@ -646,12 +650,13 @@ class TestCedarPolicyHarnessWithoutAgent:
     """Tests for adjudication without an agent configured."""
 
     @pytest.mark.asyncio
-    async def test_raises_without_initialization(self, coding_agent):
+    async def test_raises_without_initialization(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that adjudicate raises RuntimeError when not initialized."""
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("deny-all") forbid(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
 
         with pytest.raises(
@@ -671,14 +676,15 @@ class TestCedarPolicyHarnessInternalErrors:
     """Tests for internal error handling."""
 
     @pytest.mark.asyncio
-    async def test_unknown_policy_id_returns_deny(self, coding_agent):
+    async def test_unknown_policy_id_returns_deny(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that unknown determining policy IDs result in a default deny."""
         from unittest.mock import MagicMock
 
-        schema = agent_to_cedar_schema(coding_agent)
         harness = CedarPolicyHarness(
             policy_set='@id("deny-all") forbid(principal, action, resource);',
-            schema=schema,
+            schema=coding_agent_schema,
         )
         await harness.initialize(agent=coding_agent)
 
@@ -702,9 +708,8 @@ class TestCedarPolicyHarnessInternalErrors:
 class TestCedarPolicyHarnessEscalate:
     """Tests for @escalate annotation support."""
 
-    def test_escalate_on_permit_raises_error(self, coding_agent):
+    def test_escalate_on_permit_raises_error(self, coding_agent_schema):
         """Test that @escalate on permit policy raises ValueError."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("bad-policy")
         @escalate
@@ -714,7 +719,7 @@ class TestCedarPolicyHarnessEscalate:
             ValueError,
             match="@escalate is only valid on forbid policies",
         ):
-            CedarPolicyHarness(policy_set=policy, schema=schema)
+            CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -726,10 +731,13 @@ class TestCedarPolicyHarnessEscalate:
         ids=["naked", "with-value"],
     )
     async def test_escalate_on_forbid_returns_escalate_decision(
-        self, coding_agent, escalate_annotation, expected_escalate_arg
+        self,
+        coding_agent,
+        coding_agent_schema,
+        escalate_annotation,
+        expected_escalate_arg,
     ):
         """Test that @escalate on forbid policy returns ESCALATE decision."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = f"""
         @id("allow-all")
         permit(principal, action, resource);
@@ -739,7 +747,7 @@ class TestCedarPolicyHarnessEscalate:
         @description("Commands require approval")
         forbid(principal, action == CodingAgent::Action::"execute_command", resource);
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         result = await harness.adjudicate(
@@ -755,9 +763,10 @@ class TestCedarPolicyHarnessEscalate:
         assert pm.escalate_arg == (expected_escalate_arg or None)
 
     @pytest.mark.asyncio
-    async def test_mixed_escalate_and_hard_deny_returns_deny(self, coding_agent):
+    async def test_mixed_escalate_and_hard_deny_returns_deny(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that hard deny wins over escalate when both match."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -769,7 +778,7 @@ class TestCedarPolicyHarnessEscalate:
         @id("hard-deny-execute")
         forbid(principal, action == CodingAgent::Action::"execute_command", resource);
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         result = await harness.adjudicate(
@@ -784,10 +793,9 @@ class TestCedarPolicyHarnessEscalate:
 
     @pytest.mark.asyncio
     async def test_multiple_escalate_policies_returns_all_annotations(
-        self, coding_agent
+        self, coding_agent, coding_agent_schema
     ):
         """Test that multiple @escalate policies return all annotations."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -802,7 +810,7 @@ class TestCedarPolicyHarnessEscalate:
         @description("Reason B")
         forbid(principal, action == CodingAgent::Action::"execute_command", resource);
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         result = await harness.adjudicate(
@@ -822,9 +830,10 @@ class TestCedarPolicyHarnessEscalate:
         assert sorted_metadata[1].escalate_arg == "team-b"
 
     @pytest.mark.asyncio
-    async def test_escalate_does_not_affect_allow(self, coding_agent):
+    async def test_escalate_does_not_affect_allow(
+        self, coding_agent, coding_agent_schema
+    ):
         """Test that allowed actions are not affected by escalate policies."""
-        schema = agent_to_cedar_schema(coding_agent)
         policy = """
         @id("allow-all")
         permit(principal, action, resource);
@@ -833,7 +842,7 @@ class TestCedarPolicyHarnessEscalate:
         @escalate
         forbid(principal, action == CodingAgent::Action::"execute_command", resource);
         """
-        harness = CedarPolicyHarness(policy_set=policy, schema=schema)
+        harness = CedarPolicyHarness(policy_set=policy, schema=coding_agent_schema)
         await harness.initialize(agent=coding_agent)
 
         # read_file should still be allowed (not affected by execute_command escalate)
@@ -212,6 +212,34 @@ class TestAinvoke:
         result = await sg.ainvoke({"data": "input"})
         assert result == final
 
+    @pytest.mark.asyncio
+    async def test_ainvoke_parallel_nodes_batched(
+        self, mock_compiled_graph: MagicMock, mock_harness: MagicMock
+    ):
+        """Nodes from the same superstep are adjudicated in one batch call."""
+        mock_harness.adjudicates = AsyncMock(
+            return_value=[
+                Adjudicated(Decision.Allow, reason="Allowed"),
+                Adjudicated(Decision.Deny, mode=Mode.Govern, reason="Node b denied"),
+            ]
+        )
+
+        async def mock_astream(input, config=None, stream_mode=None, **kwargs):
+            yield ("updates", {"node_a": {"x": 1}, "node_b": {"x": 2}})
+            yield ("values", {"x": 2})
+
+        mock_compiled_graph.astream = mock_astream
+
+        sg = SonderaGraph(mock_compiled_graph, harness=mock_harness)
+        with pytest.raises(GuardrailViolationError) as exc_info:
+            await sg.ainvoke({"x": 0})
+
+        mock_harness.adjudicates.assert_awaited_once()
+        events = mock_harness.adjudicates.call_args.args[0]
+        assert len(events) == 2
+        mock_harness.adjudicate.assert_not_awaited()
+        assert exc_info.value.node == "node_b"
+
     @pytest.mark.asyncio
     async def test_initial_message_recording(
         self, mock_compiled_graph: MagicMock, mock_harness: MagicMock
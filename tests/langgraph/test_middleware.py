@@ -1,5 +1,6 @@
 """Tests for SonderaHarnessMiddleware."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -26,7 +27,7 @@ from sondera.langgraph.middleware import (
     State,
     Strategy,
     _deny_reason,
-    _extract_last_user_message,
+    _extract_last_user_text,
     _log_guardrails,
     _message_to_text,
 )
@@ -70,31 +71,32 @@ def test_agent() -> Agent:
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    def test_extract_last_user_message_from_human_message(self):
-        """Test extracting HumanMessage from state."""
-        state = {"messages": [HumanMessage(content="Hello")]}
-        result = _extract_last_user_message(state)
-        assert isinstance(result, HumanMessage)
-        assert result.content == "Hello"
+    def test_extract_last_user_text_from_human_message(self):
+        """Test extracting user text from a HumanMessage."""
+        state = {
+            "messages": [HumanMessage(content="Hello"), AIMessage(content="Hi")]
+        }
+        assert _extract_last_user_text(state) == "Hello"
 
-    def test_extract_last_user_message_from_dict(self):
-        """Test extracting user message from dict format."""
+    def test_extract_last_user_text_from_dict(self):
+        """Test extracting user text from dict format."""
         state = {"messages": [{"role": "user", "content": "Hello from dict"}]}
-        result = _extract_last_user_message(state)
-        assert isinstance(result, HumanMessage)
-        assert result.content == "Hello from dict"
+        assert _extract_last_user_text(state) == "Hello from dict"
+
+    def test_extract_last_user_text_from_dict_list_content(self):
+        """Test extracting user text from dict format with list content."""
+        state = {"messages": [{"role": "user", "content": ["Hello", "dict"]}]}
+        assert _extract_last_user_text(state) == "Hello dict"
 
-    def test_extract_last_user_message_empty_state(self):
+    def test_extract_last_user_text_empty_state(self):
         """Test extracting from empty state."""
         state = {"messages": []}
-        result = _extract_last_user_message(state)
-        assert result is None
+        assert _extract_last_user_text(state) is None
 
-    def test_extract_last_user_message_no_messages_key(self):
+    def test_extract_last_user_text_no_messages_key(self):
         """Test extracting when messages key is missing."""
         state = {}
-        result = _extract_last_user_message(state)
-        assert result is None
+        assert _extract_last_user_text(state) is None
 
     def test_message_to_text_string_content(self):
         """Test converting message with string content."""
@@ -254,6 +256,172 @@ class TestSonderaHarnessMiddlewareHooks:
         assert len(result.result) == 1
         assert result.result[0].content == "Model response"
 
+    @pytest.mark.asyncio
+    async def test_awrap_model_call_returns_original_response_when_all_allowed(
+        self, mock_middleware: SonderaHarnessMiddleware
+    ):
+        """Test that an all-allowed response is returned without being rebuilt."""
+        mock_middleware._harness.adjudicate.return_value = Adjudicated(
+            Decision.Allow, reason="Allowed"
+        )
+
+        request = ModelRequest(
+            model=FakeListChatModel(responses=["ok"]),
+            system_prompt=None,
+            messages=[HumanMessage(content="Hi")],
+            tool_choice=None,
+            tools=[],
+            response_format=None,
+            state={"messages": [HumanMessage(content="Hi")]},
+            runtime=Runtime(),
+            model_settings={},
+        )
+        response = ModelResponse(result=[AIMessage(content="Model response")])
+
+        async def handler(req: ModelRequest) -> ModelResponse:
+            return response
+
+        result = await mock_middleware.awrap_model_call(request, handler)
+
+        assert result is response
+        mock_middleware._harness.adjudicate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_awrap_model_call_speculative_cancels_on_pre_model_deny(
+        self, mock_harness: MagicMock
+    ):
+        """A speculative model call is cancelled when the pre-model check blocks."""
+        middleware = SonderaHarnessMiddleware(
+            harness=mock_harness, strategy=Strategy.BLOCK, speculative=True
+        )
+        handler_started = asyncio.Event()
+        handler_cancelled = False
+
+        request = ModelRequest(
+            model=None,
+            system_prompt=None,
+            messages=[HumanMessage(content="Hi"), AIMessage(content="Prior turn")],
+            tool_choice=None,
+            tools=[],
+            response_format=None,
+            state={},
+            runtime=Runtime(),
+            model_settings={},
+        )
+
+        async def handler(req: ModelRequest) -> ModelResponse:
+            nonlocal handler_cancelled
+            handler_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                handler_cancelled = True
+                raise
+            return ModelResponse(result=[AIMessage(content="Should not reach")])
+
+        async def slow_adjudicate(event):
+            await handler_started.wait()
+            return Adjudicated(
+                Decision.Deny, mode=Mode.Govern, reason="Pre-model blocked"
+            )
+
+        mock_harness.adjudicate.side_effect = slow_adjudicate
+
+        result = await middleware.awrap_model_call(request, handler)
+
+        assert handler_cancelled
+        assert "Pre-model blocked" in result.result[0].content
+
+    @pytest.mark.asyncio
+    async def test_awrap_tool_call_reuses_cached_allow_verdict(
+        self, mock_harness: MagicMock
+    ):
+        """Identical tool calls hit the verdict cache after the first adjudication."""
+        middleware = SonderaHarnessMiddleware(harness=mock_harness, cache_maxsize=8)
+        mock_harness.adjudicate.return_value = Adjudicated(Decision.Allow)
+
+        async def handler(req: ToolCallRequest) -> Command:
+            return Command()
+
+        for call_id in ("call-1", "call-2"):
+            request = ToolCallRequest(
+                tool_call={"name": "search", "args": {"q": "x"}, "id": call_id},
+                tool=None,
+                state={},
+                runtime=Runtime(),
+            )
+            await middleware.awrap_tool_call(request, handler)
+
+        assert mock_harness.adjudicate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_awrap_model_call_passes_through_response_without_ai_messages(
+        self, mock_middleware: SonderaHarnessMiddleware
+    ):
+        """A response with no AI messages is returned as-is without adjudication."""
+        request = ModelRequest(
+            model=None,
+            system_prompt=None,
+            messages=[HumanMessage(content="Hi")],
+            tool_choice=None,
+            tools=[],
+            response_format=None,
+            state={},
+            runtime=Runtime(),
+            model_settings={},
+        )
+        response = ModelResponse(
+            result=[ToolMessage(content="done", tool_call_id="call-1")]
+        )
+
+        async def handler(req: ModelRequest) -> ModelResponse:
+            return response
+
+        result = await mock_middleware.awrap_model_call(request, handler)
+
+        assert result is response
+        mock_middleware._harness.adjudicate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_awrap_model_call_batches_post_model_adjudication(
+        self, mock_harness: MagicMock
+    ):
+        """Several AI messages in one response are adjudicated in one batch call."""
+        middleware = SonderaHarnessMiddleware(
+            harness=mock_harness, strategy=Strategy.STEER
+        )
+        mock_harness.adjudicates = AsyncMock(
+            return_value=[
+                Adjudicated(Decision.Allow, reason="Allowed"),
+                Adjudicated(Decision.Deny, mode=Mode.Govern, reason="Second denied"),
+            ]
+        )
+
+        request = ModelRequest(
+            model=None,
+            system_prompt=None,
+            messages=[HumanMessage(content="Hi")],
+            tool_choice=None,
+            tools=[],
+            response_format=None,
+            state={},
+            runtime=Runtime(),
+            model_settings={},
+        )
+
+        async def handler(req: ModelRequest) -> ModelResponse:
+            return ModelResponse(
+                result=[AIMessage(content="first"), AIMessage(content="second")]
+            )
+
+        result = await middleware.awrap_model_call(request, handler)
+
+        mock_harness.adjudicates.assert_awaited_once()
+        assert len(mock_harness.adjudicates.call_args.args[0]) == 2
+        mock_harness.adjudicate.assert_not_called()
+        assert result.result[0].content == "first"
+        assert "Second denied" in result.result[1].content
+
     @pytest.mark.asyncio
     async def test_awrap_model_call_returns_policy_message_on_pre_model_deny(
         self, mock_middleware: SonderaHarnessMiddleware
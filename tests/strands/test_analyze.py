@@ -0,0 +1,96 @@
+"""Unit tests for Strands tool reflection helpers.
+
+Note: These tests require the 'strands' optional dependency.
+Install with: uv pip install -e ".[strands]"
+"""
+
+import gc
+import weakref
+
+import pytest
+
+# Skip this module if strands is not installed
+pytest.importorskip("strands", reason="strands package not installed")
+
+from sondera.strands import analyze
+
+
+def test_signature_cache_does_not_keep_tools_alive():
+    def tool(query: str, limit: int = 10) -> str:
+        return query
+
+    assert list(analyze._signature(tool).parameters) == ["query", "limit"]
+    assert analyze._type_hints(tool) == {"query": str, "limit": int, "return": str}
+    assert analyze._signature(tool) is analyze._signature(tool)
+
+    ref = weakref.ref(tool)
+    del tool
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_uncacheable_callables_are_still_reflected():
+    class Tool:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, x: int) -> int:
+            return x
+
+    assert list(analyze._signature(Tool()).parameters) == ["x"]
+
+
+def _descriptions(func) -> dict[str, str]:
+    return {p.name: p.description for p in analyze._analyze_function_parameters(func)}
+
+
+def test_google_style_parameter_descriptions():
+    def tool(query: str, limit: int = 10) -> str:
+        """Search for information.
+
+        Args:
+            query: Search query string
+            limit (int): Maximum number of results
+        """
+        return query
+
+    assert _descriptions(tool) == {
+        "query": "Search query string",
+        "limit": "Maximum number of results",
+    }
+
+
+def test_sphinx_style_parameter_descriptions():
+    def tool(path: str, mode: str = "r") -> str:
+        """Open a file.
+
+        :param path: File path to open
+        :param str mode: Open mode
+        """
+        return path
+
+    assert _descriptions(tool) == {"path": "File path to open", "mode": "Open mode"}
+
+
+def test_summary_mentioning_a_parameter_does_not_win():
+    def tool(query: str) -> str:
+        """Run query against the index and return the query results.
+
+        Args:
+            query: Search query string
+        """
+        return query
+
+    assert _descriptions(tool) == {"query": "Search query string"}
+
+
+def test_undocumented_parameter_falls_back_to_its_name():
+    def tool(query: str, limit: int = 10) -> str:
+        """Search for information.
+
+        Args:
+            query: Search query string
+        """
+        return query
+
+    assert _descriptions(tool)["limit"] == "Parameter limit"
@@ -213,6 +213,57 @@ class TestSonderaStrandsHarnessHooks:
         assert event.cancel_tool is not None
         assert "Tool not allowed" in event.cancel_tool
 
+    @pytest.mark.asyncio
+    async def test_before_tool_call_reuses_cached_allow_verdict(
+        self, mock_harness: MagicMock
+    ):
+        """Test that a repeated tool call is served from the verdict cache."""
+        hook = SonderaHarnessHook(harness=mock_harness, cache_maxsize=16)
+
+        for tool_input in ({"a": 1, "b": 2}, {"b": 2, "a": 1}):
+            event = BeforeToolCallEvent(
+                agent=Mock(),
+                selected_tool=Mock(),
+                tool_use={"name": "test_tool", "input": tool_input},
+                invocation_state={},
+            )
+            await hook._on_before_tool_call(event)
+            assert not event.cancel_tool
+
+        mock_harness.adjudicate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deferred_post_model_rides_with_next_adjudication(
+        self, mock_harness: MagicMock
+    ):
+        """Test that deferred post-model events are batched with the next call."""
+        mock_harness.adjudicates = AsyncMock(
+            return_value=[Adjudicated.allow(), Adjudicated.allow()]
+        )
+        hook = SonderaHarnessHook(harness=mock_harness, defer_post_model=True)
+
+        stop_response = Mock()
+        stop_response.message = {"content": "Calling a tool"}
+        await hook._on_after_model_call(
+            AfterModelCallEvent(
+                agent=Mock(), stop_response=stop_response, exception=None
+            )
+        )
+        mock_harness.adjudicate.assert_not_called()
+
+        await hook._on_before_tool_call(
+            BeforeToolCallEvent(
+                agent=Mock(),
+                selected_tool=Mock(),
+                tool_use={"name": "test_tool", "input": {}},
+                invocation_state={},
+            )
+        )
+
+        mock_harness.adjudicate.assert_not_called()
+        mock_harness.adjudicates.assert_awaited_once()
+        assert len(mock_harness.adjudicates.await_args.args[0]) == 2
+
     def test_extract_text_from_before_model_call_event(self, mock_harness: MagicMock):
         """Test text extraction from BeforeModelCallEvent."""
         hook = SonderaHarnessHook(harness=mock_harness)
@@ -232,13 +283,33 @@ class TestSonderaStrandsHarnessHooks:
         event = BeforeModelCallEvent(agent=mock_agent)
 
         # Extract text
-        text = hook._extract_text_from_event(event)
+        text = hook._before_model_text(event)
 
         # Should extract conversation
         assert isinstance(text, str)
         assert "user: Hello" in text
         assert "assistant: Hi there" in text
 
+    def test_extract_text_tracks_growing_and_trimmed_conversation(
+        self, mock_harness: MagicMock
+    ):
+        """Test that cached conversation text follows appends and trims."""
+        hook = SonderaHarnessHook(harness=mock_harness)
+        mock_agent = Mock()
+        messages = [{"role": "user", "content": "Hello"}]
+        mock_agent.conversation_manager.messages = messages
+        event = BeforeModelCallEvent(agent=mock_agent)
+
+        assert hook._before_model_text(event) == "user: Hello"
+
+        messages.append({"role": "assistant", "content": "Hi there"})
+        assert hook._before_model_text(event) == (
+            "user: Hello\nassistant: Hi there"
+        )
+
+        del messages[0]
+        assert hook._before_model_text(event) == "assistant: Hi there"
+
     def test_extract_text_from_after_model_call_event(self, mock_harness: MagicMock):
         """Test text extraction from AfterModelCallEvent."""
         hook = SonderaHarnessHook(harness=mock_harness)
@@ -254,7 +325,7 @@ class TestSonderaStrandsHarnessHooks:
         )
 
         # Extract text
-        text = hook._extract_text_from_event(event)
+        text = hook._after_model_text(event)
 
         assert isinstance(text, str)
         assert "Hello, how can I help?" in text
@@ -263,16 +334,18 @@ class TestSonderaStrandsHarnessHooks:
 class TestSonderaStrandsHarnessHelperMethods:
     """Test helper methods."""
 
-    def test_extract_text_from_event_fallback(self, mock_harness: MagicMock):
-        """Test text extraction fallback for unknown event types."""
+    def test_extract_text_without_content(self, mock_harness: MagicMock):
+        """Test that events with nothing to adjudicate extract as empty text."""
         hook = SonderaHarnessHook(harness=mock_harness)
 
-        # Create unknown event type
-        unknown_event = Mock()
+        # No conversation manager messages and no stop response
+        mock_agent = Mock()
+        mock_agent.conversation_manager.messages = []
+        before = BeforeModelCallEvent(agent=mock_agent)
+        after = AfterModelCallEvent(agent=Mock(), stop_response=None, exception=None)
 
-        # Should return empty string for unknown events
-        text = hook._extract_text_from_event(unknown_event)
-        assert text == ""
+        assert hook._before_model_text(before) == ""
+        assert hook._after_model_text(after) == ""
 
     def test_custom_logger_injection(self, mock_harness: MagicMock):
         """Test that custom logger can be injected."""
@@ -0,0 +1,93 @@
+"""Tests for the in-process adjudication verdict cache."""
+
+import pytest
+
+from sondera import (
+    Adjudicated,
+    Decision,
+    GuardrailResults,
+    SignatureGuardrailMatch,
+    SignatureGuardrailResult,
+)
+from sondera.harness import AdjudicationCache
+from sondera.harness import cache as cache_module
+
+
+def test_get_returns_stored_allow_verdict():
+    cache = AdjudicationCache()
+    key = AdjudicationCache.key("prompt", "user", "hello")
+    allowed = Adjudicated(Decision.Allow, reason="ok")
+
+    assert cache.get(key) is None
+    cache.put(key, allowed)
+    assert cache.get(key) is allowed
+
+
+@pytest.mark.parametrize("decision", [Decision.Deny, Decision.Escalate])
+def test_non_allow_verdicts_are_not_cached(decision: Decision):
+    cache = AdjudicationCache()
+    key = AdjudicationCache.key("prompt", "user", "hello")
+
+    cache.put(key, Adjudicated(decision, reason="no"))
+
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_allow_with_triggered_signature_is_not_cached():
+    cache = AdjudicationCache()
+    key = AdjudicationCache.key("tool_output", "read_file", "secret")
+    flagged = Adjudicated(
+        Decision.Allow,
+        reason="allowed with findings",
+        guardrails=GuardrailResults(
+            signature=SignatureGuardrailResult(
+                triggered=True,
+                severity="LOW",
+                categories=["pii"],
+                matches=[SignatureGuardrailMatch("detect_pii")],
+            ),
+        ),
+    )
+
+    cache.put(key, flagged)
+
+    assert cache.get(key) is None
+
+
+def test_key_respects_part_boundaries():
+    assert AdjudicationCache.key("ab", "c") != AdjudicationCache.key("a", "bc")
+    assert AdjudicationCache.key("a", "b") == AdjudicationCache.key("a", "b")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AdjudicationCache(maxsize=2)
+    a, b, c = (AdjudicationCache.key(name) for name in "abc")
+    allowed = Adjudicated(Decision.Allow)
+
+    cache.put(a, allowed)
+    cache.put(b, allowed)
+    cache.get(a)  # refresh a so b is the oldest
+    cache.put(c, allowed)
+
+    assert cache.get(a) is allowed
+    assert cache.get(b) is None
+    assert cache.get(c) is allowed
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = AdjudicationCache(ttl=5.0)
+    key = AdjudicationCache.key("x")
+    cache.put(key, Adjudicated(Decision.Allow))
+
+    now = 104.0
+    assert cache.get(key) is not None
+    now = 105.0
+    assert cache.get(key) is None
+
+
+def test_rejects_non_positive_maxsize():
+    with pytest.raises(ValueError):
+        AdjudicationCache(maxsize=0)
@@ -88,6 +88,16 @@ class TestHarnessConstructor:
         assert harness.trajectory_id is None
         assert harness.agent is None
 
+    def test_reuses_provided_client(self, harness: SonderaRemoteHarness):
+        with patch("sondera.harness.sondera.harness.HarnessClient") as client_cls:
+            other = SonderaRemoteHarness(
+                sondera_api_key="test-key",  # pragma: allowlist secret
+                client=harness.client,
+            )
+
+        client_cls.assert_not_called()
+        assert other.client is harness.client
+
 
 class TestInitialize:
     async def test_registers_agent_and_creates_trajectory(
@@ -0,0 +1,37 @@
+"""Tests for building dashboard violation records from adjudication events."""
+
+from __future__ import annotations
+
+from sondera import Adjudicated, Agent, Decision, Event
+from sondera.tui.events import violations_from_events
+
+
+def _adjudication(decision: Decision, trajectory_id: str = "traj-1") -> Event:
+    return Event(
+        agent=Agent(id="agent-1", provider="test"),
+        trajectory_id=trajectory_id,
+        event=Adjudicated(decision, reason=f"{decision} reason"),
+    )
+
+
+def test_only_deny_and_escalate_become_records():
+    events = [
+        _adjudication(Decision.Allow),
+        _adjudication(Decision.Deny),
+        _adjudication(Decision.Escalate),
+    ]
+
+    records = violations_from_events(events)
+
+    assert [r.decision for r in records] == [Decision.Deny, Decision.Escalate]
+    assert [r.step_index for r in records] == [1, 2]
+    assert records[0].agent_id == "agent-1"
+
+
+def test_start_offsets_step_index_for_appended_events():
+    events = [_adjudication(Decision.Allow), _adjudication(Decision.Deny)]
+
+    whole = violations_from_events(events)
+    tail = violations_from_events(events[1:], start=1)
+
+    assert [r.step_index for r in tail] == [r.step_index for r in whole]
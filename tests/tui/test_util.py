@@ -0,0 +1,18 @@
+"""Tests for shared TUI text helpers."""
+
+from __future__ import annotations
+
+from sondera.tui.util import truncate
+
+
+def test_truncate_leaves_fitting_text_alone():
+    assert truncate("short", 5) == "short"
+
+
+def test_truncate_fits_result_within_limit_by_default():
+    assert truncate("abcdefgh", 5) == "abcd…"
+    assert truncate("abcdefgh", 6, ellipsis="...") == "abc..."
+
+
+def test_truncate_honours_explicit_head():
+    assert truncate("abcdefgh", 6, 3) == "abc…"